@@ -0,0 +1,50 @@
+"""
+JSON helpers.
+
+Uses orjson when it is installed (``pip install polymarket-scanner[speedups]``)
+and falls back to the stdlib json module otherwise. Both paths produce
+compact output and serialize Decimal and datetime values, so domain objects
+such as ``Market.metadata`` or signal metadata can be dumped directly.
+"""
+
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None  # type: ignore[assignment]
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types neither encoder handles natively."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def loads(data: str | bytes) -> Any:
+        """Decode JSON from str or bytes."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> str:
+        """Encode obj as compact JSON text."""
+        return orjson.dumps(obj, default=_default).decode()
+
+else:
+    JSONDecodeError = json.JSONDecodeError
+
+    def loads(data: str | bytes) -> Any:
+        """Decode JSON from str or bytes."""
+        return json.loads(data)
+
+    def dumps(obj: Any) -> str:
+        """Encode obj as compact JSON text."""
+        return json.dumps(obj, separators=(",", ":"), default=_default)
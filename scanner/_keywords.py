@@ -0,0 +1,112 @@
+"""
+Multi-keyword substring matching.
+
+Uses a pyahocorasick automaton when it is installed
+(``pip install polymarket-scanner[speedups]``) and a pure-Python trie
+otherwise.
+"""
+
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import lru_cache
+from typing import Any, TypeVar
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - depends on installed extras
+    ahocorasick = None
+
+L = TypeVar("L")
+
+
+def build_keyword_matcher(
+    keywords: Iterable[str],
+) -> Callable[[str], Iterator[tuple[int, str]]]:
+    """
+    Build a multi-keyword matcher that scans text in a single pass.
+
+    The fallback trie is a dict-of-dicts walked from every start position.
+
+    Args:
+        keywords: Lowercase keywords to match.
+
+    Returns:
+        Function yielding (end_index, keyword) for every occurrence in text.
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+
+        def iter_matches(text: str) -> Iterator[tuple[int, str]]:
+            for last, keyword in automaton.iter(text):
+                yield last + 1, keyword
+
+        return iter_matches
+
+    trie: dict[str | None, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[None] = keyword
+
+    def iter_matches(text: str) -> Iterator[tuple[int, str]]:
+        size = len(text)
+        for start in range(size):
+            node = trie
+            for pos in range(start, size):
+                node = node.get(text[pos])
+                if node is None:
+                    break
+                keyword = node.get(None)
+                if keyword is not None:
+                    yield pos + 1, keyword
+
+    return iter_matches
+
+
+def build_keyword_classifier(
+    keywords_by_label: Mapping[L, Iterable[str]],
+    default: L,
+    cache_size: int,
+) -> Callable[..., L]:
+    """
+    Build a memoized classifier that labels texts by their keywords.
+
+    Labels are given in priority order: among all keywords found, the one
+    belonging to the earliest label wins. Each text passed to the
+    classifier is lowercased and scanned on its own, so keywords never
+    span two texts.
+
+    Args:
+        keywords_by_label: Lowercase keywords per label, highest priority first.
+        default: Label returned when no keyword matches.
+        cache_size: Distinct argument tuples whose label is memoized.
+
+    Returns:
+        Function mapping one or more texts to a label.
+    """
+    # Keyword -> (priority, label); lower priority wins
+    word_labels: dict[str, tuple[int, L]] = {
+        word: (priority, label)
+        for priority, (label, words) in enumerate(keywords_by_label.items())
+        for word in words
+    }
+    match = build_keyword_matcher(word_labels)
+    lowest = len(keywords_by_label)
+
+    @lru_cache(maxsize=cache_size)
+    def classify(*texts: str) -> L:
+        label = default
+        best = lowest
+        for text in texts:
+            for _, word in match(text.lower()):
+                priority, word_label = word_labels[word]
+                if priority < best:
+                    best, label = priority, word_label
+                    if priority == 0:
+                        return label
+        return label
+
+    return classify
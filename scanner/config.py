@@ -1,6 +1,8 @@
 """Configuration settings for the scanner."""
 
 from decimal import Decimal
+from functools import lru_cache
+from typing import Any
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -58,6 +60,14 @@ class ScannerConfig(BaseSettings):
         default=3, description="Minimum trades for clustering detection"
     )
 
+    # Cache settings (least recently used entries are evicted first)
+    market_cache_size: int = Field(
+        default=10_000, description="Maximum number of cached markets"
+    )
+    wallet_cache_size: int = Field(
+        default=100_000, description="Maximum number of cached wallet profiles"
+    )
+
     # Output settings
     log_level: str = Field(default="INFO", description="Logging level")
 
@@ -84,6 +94,10 @@ class ScannerConfig(BaseSettings):
         default=137,
         description="Chain ID (137 for Polygon mainnet)",
     )
+    clob_stream_trades: bool = Field(
+        default=False,
+        description="Stream CLOB trades over the market WebSocket instead of polling the Data API",
+    )
 
     model_config = {
         "env_prefix": "SCANNER_",
@@ -92,6 +106,20 @@ class ScannerConfig(BaseSettings):
     }
 
 
-# Global config instance
-config = ScannerConfig()
+@lru_cache(maxsize=1)
+def get_config() -> ScannerConfig:
+    """
+    Get the global scanner configuration.
+
+    The instance is created on first call, so importing scanner modules does
+    not parse ``.env`` or the environment until settings are actually needed.
+    """
+    return ScannerConfig()
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily resolve the module-level ``config`` instance (PEP 562)."""
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
@@ -1,5 +1,6 @@
 """Domain models for the Polymarket scanner."""
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -50,7 +51,7 @@ class SignalType(str, Enum):
     TRADE_CLUSTERING = "TradeClustering"
 
 
-@dataclass
+@dataclass(slots=True)
 class Market:
     """Market information."""
 
@@ -64,19 +65,39 @@ class Market:
     liquidity: Decimal = Decimal("0")
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    # Short-lived is_active memo (monotonic seconds)
+    _active: bool = field(default=True, init=False, repr=False, compare=False)
+    _active_checked_at: float = field(default=-1.0, init=False, repr=False, compare=False)
+
+    # How long a computed is_active value is reused, in seconds
+    ACTIVE_CACHE_TTL = 1.0
+
+    def __post_init__(self) -> None:
+        """Normalize end date to UTC-aware once."""
+        if self.end_date is not None:
+            self.end_date = _make_aware(self.end_date)
+
     @property
     def is_active(self) -> bool:
         """Check if market is still active."""
         if self.end_date is None:
             return True
-        # Handle both timezone-aware and naive datetimes
-        end = _make_aware(self.end_date)
-        return _utc_now() < end
+
+        now = time.monotonic()
+        if now - self._active_checked_at >= self.ACTIVE_CACHE_TTL:
+            self._active = _utc_now() < self.end_date
+            self._active_checked_at = now
+        return self._active
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
-    """A single trade from Polymarket."""
+    """
+    A single trade from Polymarket.
+
+    ``size_usd_f`` is a float copy of ``size_usd`` computed once at
+    construction for threshold checks on the hot path.
+    """
 
     id: str
     market_id: str
@@ -87,14 +108,19 @@ class Trade:
     timestamp: datetime
     market: Market | None = None
     raw_data: dict[str, Any] = field(default_factory=dict)
+    size_usd_f: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Cache float view of the trade size."""
+        self.size_usd_f = float(self.size_usd)
 
     @property
     def is_buy(self) -> bool:
         """Check if this is a buy trade."""
-        return self.side == TradeSide.YES
+        return self.side is TradeSide.YES
 
 
-@dataclass
+@dataclass(slots=True)
 class WalletProfile:
     """Wallet profile with historical data."""
 
@@ -108,6 +134,13 @@ class WalletProfile:
     preferred_categories: list[MarketCategory] = field(default_factory=list)
     is_suspected_lp: bool = False
 
+    def __post_init__(self) -> None:
+        """Normalize activity timestamps to UTC-aware once."""
+        if self.first_seen is not None:
+            self.first_seen = _make_aware(self.first_seen)
+        if self.last_seen is not None:
+            self.last_seen = _make_aware(self.last_seen)
+
     @property
     def is_fresh(self) -> bool:
         """Check if wallet is fresh (new or low activity)."""
@@ -118,12 +151,10 @@ class WalletProfile:
         """Calculate days since first activity."""
         if self.first_seen is None:
             return 0
-        # Handle both timezone-aware and naive datetimes
-        first = _make_aware(self.first_seen)
-        return (_utc_now() - first).days
+        return (_utc_now() - self.first_seen).days
 
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
     """A detected signal on a trade."""
 
@@ -133,7 +164,7 @@ class Signal:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Alert:
     """Enriched alert ready for output."""
 
@@ -6,24 +6,33 @@ from dataclasses import dataclass
 from scanner.domain.models import Trade
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FilterResult:
-    """Result of a filter check."""
+    """
+    Result of a filter check.
+
+    Results are immutable, so accept() always returns one shared instance.
+    Filters keep rejections with a fixed reason as module constants and
+    build per-trade ones directly.
+    """
 
     passed: bool
     reason: str | None = None
 
     @classmethod
     def accept(cls) -> "FilterResult":
-        """Create a passing result."""
-        return cls(passed=True)
+        """Get the passing result."""
+        return _ACCEPT
 
     @classmethod
     def reject(cls, reason: str) -> "FilterResult":
-        """Create a rejecting result with reason."""
+        """Get a rejecting result with reason."""
         return cls(passed=False, reason=reason)
 
 
+_ACCEPT = FilterResult(passed=True)
+
+
 class TradeFilter(ABC):
     """Abstract base class for trade filters."""
 
@@ -46,6 +55,54 @@ class TradeFilter(ABC):
         """
         ...
 
+    async def prefetch(self, trades: list[Trade]) -> None:
+        """
+        Load whatever data checking a batch needs, in bulk.
+
+        Called by the pipeline before check_batch() on each batch that
+        reaches this filter. The default does nothing.
+
+        Args:
+            trades: Trades about to be checked.
+        """
+
+    def check_batch(self, trades: list[Trade]) -> list[FilterResult] | None:
+        """
+        Check a batch of trades synchronously.
+
+        Filters that need no I/O can override this so the pipeline checks a
+        whole batch in one pass instead of awaiting check() per trade. The
+        default returns None, which makes the pipeline fall back to check().
+
+        Args:
+            trades: Trades to check.
+
+        Returns:
+            One FilterResult per trade, in the same order, or None.
+        """
+        return None
+
+    @property
+    def cost(self) -> int:
+        """
+        Relative cost of check(), used by the pipeline to order filters.
+
+        Cheap in-memory checks keep the default; filters that may hit the
+        network should return a higher value.
+        """
+        return 1
+
+    @property
+    def is_pure(self) -> bool:
+        """
+        Whether check() is independent of other filters and of which trades
+        this filter has seen.
+
+        Pure filters may be run concurrently and cancelled once another
+        filter rejects the trade. Stateful filters must return False.
+        """
+        return True
+
     @property
     def enabled(self) -> bool:
         """Whether filter is enabled. Override to disable."""
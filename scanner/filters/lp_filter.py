@@ -1,32 +1,80 @@
 """Liquidity Provider detection filter."""
 
+import time
+from array import array
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal
+from functools import partial
 
-from scanner.config import ScannerConfig, config as default_config
+from scanner.config import ScannerConfig, get_config
 from scanner.domain.models import Trade, TradeSide
 from scanner.filters.base import FilterResult, TradeFilter
 
 
-@dataclass
+# How long wallet trades are kept for LP heuristics
+HISTORY_MAX_AGE = timedelta(hours=24)
+
+# Rejection for repetitive patterns; its reason never varies
+_REPETITIVE_REJECTION = FilterResult.reject("Repetitive symmetric trading pattern detected")
+
+
+@dataclass(slots=True)
 class WalletTradeHistory:
-    """Track recent trades for a wallet."""
+    """
+    Track recent trades for a wallet.
 
-    trades: list[tuple[datetime, TradeSide, Decimal]] = field(default_factory=list)
-    yes_volume: Decimal = Decimal("0")
-    no_volume: Decimal = Decimal("0")
+    Trades are stored column-wise in typed arrays (epoch seconds, is_yes,
+    size_usd) instead of one tuple of objects per trade, sorted by
+    timestamp since feeds may deliver trades out of order. The LP heuristics
+    are threshold-based, so Decimal precision buys nothing here and only
+    slows down the per-trade bookkeeping.
+    """
+
+    timestamps: array = field(default_factory=lambda: array("d"))
+    sides: array = field(default_factory=lambda: array("b"))
+    sizes: array = field(default_factory=lambda: array("d"))
+    yes_volume: float = 0.0
+    no_volume: float = 0.0
+    window_size: int = 10
+
+    # Sides of the last ``window_size`` trades as a bitmap (bit 0 = newest,
+    # 1 = YES), so alternations are popcount(bits ^ (bits >> 1))
+    _side_bits: int = field(default=0, init=False, repr=False)
+    _window_mask: int = field(init=False, repr=False)
+    _pair_mask: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Precompute bit masks for the side window."""
+        self._window_mask = (1 << self.window_size) - 1
+        # window_size trades form window_size - 1 adjacent pairs
+        self._pair_mask = (1 << max(self.window_size - 1, 0)) - 1
 
     def add_trade(self, timestamp: datetime, side: TradeSide, size: Decimal) -> None:
         """Add a trade to history."""
-        self.trades.append((timestamp, side, size))
-        if side == TradeSide.YES:
-            self.yes_volume += size
+        size_f = float(size)
+        is_yes = side is TradeSide.YES
+        ts = timestamp.timestamp()
+        timestamps = self.timestamps
+        if not timestamps or timestamps[-1] <= ts:
+            timestamps.append(ts)
+            self.sides.append(is_yes)
+            self.sizes.append(size_f)
+        else:
+            # Out-of-order trade: keep the columns sorted so expiry stays a prefix
+            index = bisect_right(timestamps, ts)
+            timestamps.insert(index, ts)
+            self.sides.insert(index, is_yes)
+            self.sizes.insert(index, size_f)
+        self._side_bits = ((self._side_bits << 1) | is_yes) & self._window_mask
+        if is_yes:
+            self.yes_volume += size_f
         else:
-            self.no_volume += size
+            self.no_volume += size_f
 
-    def get_balance_ratio(self) -> Decimal:
+    def get_balance_ratio(self) -> float:
         """
         Calculate balance ratio between YES and NO positions.
 
@@ -34,48 +82,54 @@ class WalletTradeHistory:
         """
         total = self.yes_volume + self.no_volume
         if total == 0:
-            return Decimal("1")
+            return 1.0
 
-        yes_ratio = self.yes_volume / total
         # Distance from 0.5 (perfect balance), normalized to 0-1
-        return abs(yes_ratio - Decimal("0.5")) * 2
+        return abs(self.yes_volume / total - 0.5) * 2.0
 
-    def is_repetitive(self, window_size: int) -> bool:
+    def is_repetitive(self) -> bool:
         """
-        Check for repetitive symmetric trading pattern.
-
-        Args:
-            window_size: Number of recent trades to analyze.
+        Check for repetitive symmetric trading pattern over the last
+        ``window_size`` trades.
 
         Returns:
             True if pattern suggests LP behavior.
         """
-        if len(self.trades) < window_size:
+        if len(self.timestamps) < self.window_size:
             return False
 
-        recent = self.trades[-window_size:]
-
-        # Count alternating trades
-        alternating_count = 0
-        for i in range(1, len(recent)):
-            if recent[i][1] != recent[i - 1][1]:
-                alternating_count += 1
+        bits = self._side_bits
+        alternating_count = ((bits ^ (bits >> 1)) & self._pair_mask).bit_count()
 
         # If most trades alternate, likely LP
-        return alternating_count >= (window_size - 1) * 0.7
+        return alternating_count >= (self.window_size - 1) * 0.7
 
     def cleanup_old(self, max_age: timedelta) -> None:
         """Remove trades older than max_age."""
-        cutoff = datetime.now() - max_age
-        self.trades = [t for t in self.trades if t[0] >= cutoff]
-
-        # Recalculate volumes
-        self.yes_volume = sum(
-            t[2] for t in self.trades if t[1] == TradeSide.YES
-        )
-        self.no_volume = sum(
-            t[2] for t in self.trades if t[1] == TradeSide.NO
-        )
+        # Entries hold epoch seconds, so a plain time.time() avoids building
+        # datetime/timedelta objects on every trade
+        cutoff = time.time() - max_age.total_seconds()
+        timestamps = self.timestamps
+        if not timestamps or timestamps[0] >= cutoff:
+            return
+
+        # Columns are sorted by timestamp, so expired entries form a prefix;
+        # subtract them from the running volumes instead of rescanning.
+        expired = bisect_left(timestamps, cutoff)
+        for is_yes, size in zip(self.sides[:expired], self.sizes[:expired]):
+            if is_yes:
+                self.yes_volume -= size
+            else:
+                self.no_volume -= size
+
+        del timestamps[:expired]
+        del self.sides[:expired]
+        del self.sizes[:expired]
+
+        if not timestamps:
+            # Reset to avoid accumulating float drift on idle wallets
+            self.yes_volume = 0.0
+            self.no_volume = 0.0
 
 
 class LPFilter(TradeFilter):
@@ -94,16 +148,28 @@ class LPFilter(TradeFilter):
         Args:
             config: Scanner configuration.
         """
-        self._config = config or default_config
-        self._balance_threshold = self._config.lp_balance_threshold
+        self._config = config or get_config()
+        self._balance_threshold = float(self._config.lp_balance_threshold)
         self._repetition_window = self._config.lp_repetition_window
-        self._wallet_history: dict[str, WalletTradeHistory] = defaultdict(WalletTradeHistory)
+        self._wallet_history: dict[str, WalletTradeHistory] = defaultdict(
+            partial(WalletTradeHistory, window_size=self._repetition_window)
+        )
 
     @property
     def name(self) -> str:
         """Filter name."""
         return "LPFilter"
 
+    @property
+    def cost(self) -> int:
+        """Per-wallet history bookkeeping on every check."""
+        return 2
+
+    @property
+    def is_pure(self) -> bool:
+        """Records every checked trade in the wallet history."""
+        return False
+
     async def check(self, trade: Trade) -> FilterResult:
         """
         Check if trade appears to be from a liquidity provider.
@@ -118,7 +184,7 @@ class LPFilter(TradeFilter):
         history = self._wallet_history[wallet]
 
         # Cleanup old trades (keep last 24 hours)
-        history.cleanup_old(timedelta(hours=24))
+        history.cleanup_old(HISTORY_MAX_AGE)
 
         # Add current trade to history
         history.add_trade(trade.timestamp, trade.side, trade.size_usd)
@@ -131,8 +197,8 @@ class LPFilter(TradeFilter):
             )
 
         # Check for repetitive patterns
-        if history.is_repetitive(self._repetition_window):
-            return FilterResult.reject("Repetitive symmetric trading pattern detected")
+        if history.is_repetitive():
+            return _REPETITIVE_REJECTION
 
         return FilterResult.accept()
 
@@ -1,15 +1,25 @@
 """Market category filter."""
 
 import logging
+from typing import TYPE_CHECKING
 
-from scanner.config import ScannerConfig, config as default_config
+from scanner.config import ScannerConfig, get_config
 from scanner.domain.models import Market, MarketCategory, Trade
 from scanner.filters.base import FilterResult, TradeFilter
-from scanner.services.market_service import MarketService
+
+if TYPE_CHECKING:
+    from scanner.services.market_service import MarketService
 
 
 logger = logging.getLogger(__name__)
 
+# Rejections with a fixed reason, shared by every trade they apply to
+_MARKET_UNAVAILABLE = FilterResult.reject("Market data not available")
+_MARKET_INACTIVE = FilterResult.reject("Market is no longer active")
+
+# One bit per category, so exclusion is a single AND against an int mask
+_CATEGORY_BIT: dict[MarketCategory, int] = {c: 1 << i for i, c in enumerate(MarketCategory)}
+
 
 class MarketFilter(TradeFilter):
     """
@@ -22,7 +32,7 @@ class MarketFilter(TradeFilter):
     def __init__(
         self, 
         config: ScannerConfig | None = None,
-        market_service: MarketService | None = None,
+        market_service: "MarketService | None" = None,
     ):
         """
         Initialize market filter.
@@ -31,15 +41,27 @@ class MarketFilter(TradeFilter):
             config: Scanner configuration. Uses default if not provided.
             market_service: Service for fetching market data. Creates new if not provided.
         """
-        self._config = config or default_config
-        self._excluded = set(self._config.excluded_categories)
-        self._market_service = market_service or MarketService()
+        self._config = config or get_config()
+        self._excluded_mask = 0
+        for category in self._config.excluded_categories:
+            self._excluded_mask |= _CATEGORY_BIT[category]
+        if market_service is None:
+            # Imported lazily: pulls in aiohttp and the REST layer
+            from scanner.services.market_service import MarketService
+
+            market_service = MarketService(self._config)
+        self._market_service = market_service
 
     @property
     def name(self) -> str:
         """Filter name."""
         return "MarketFilter"
 
+    @property
+    def cost(self) -> int:
+        """May fetch market data over the network."""
+        return 10
+
     async def check(self, trade: Trade) -> FilterResult:
         """
         Check if trade's market category is allowed.
@@ -60,33 +82,87 @@ class MarketFilter(TradeFilter):
             
             if market is None:
                 logger.debug(f"Could not fetch market for trade {trade.id}")
-                return FilterResult.reject("Market data not available")
+                return _MARKET_UNAVAILABLE
             
             # Attach market to trade for downstream processing
             trade.market = market
 
+        return self._check_market(market)
+
+    async def prefetch(self, trades: list[Trade]) -> None:
+        """
+        Fetch and attach the markets missing from a batch of trades.
+
+        Each distinct market is requested once, in bulk where the API
+        allows it.
+
+        Args:
+            trades: Trades about to be checked.
+        """
+        missing = {t.market_id: t.raw_data for t in trades if t.market is None}
+        if not missing:
+            return
+
+        fetched = await self._market_service.get_markets(missing, raw_data=missing)
+        for trade in trades:
+            if trade.market is None:
+                trade.market = fetched.get(trade.market_id)
+
+    def check_batch(self, trades: list[Trade]) -> list[FilterResult]:
+        """
+        Check a batch of trades whose markets were prefetched.
+
+        Trades still without a market after prefetch() are rejected, as
+        check() does when the lookup fails.
+
+        Args:
+            trades: Trades to check.
+
+        Returns:
+            One FilterResult per trade, in the same order.
+        """
+        results = []
+        for trade in trades:
+            market = trade.market
+            if market is None:
+                logger.debug(f"Could not fetch market for trade {trade.id}")
+                results.append(_MARKET_UNAVAILABLE)
+            else:
+                results.append(self._check_market(market))
+        return results
+
+    def _check_market(self, market: Market) -> FilterResult:
+        """
+        Check market category and activity.
+
+        Args:
+            market: Market the trade belongs to.
+
+        Returns:
+            FilterResult - rejected if category is excluded or market ended.
+        """
         category = market.category
         
         logger.debug(
             f"Market '{market.question[:50]}...' category: {category.value}"
         )
 
-        if category in self._excluded:
+        if self._excluded_mask & _CATEGORY_BIT[category]:
             return FilterResult.reject(
                 f"Market category '{category.value}' is excluded"
             )
 
         # Check if market is still active
         if not market.is_active:
-            return FilterResult.reject("Market is no longer active")
+            return _MARKET_INACTIVE
 
         return FilterResult.accept()
 
     def add_excluded_category(self, category: MarketCategory) -> None:
         """Add a category to exclusion list."""
-        self._excluded.add(category)
+        self._excluded_mask |= _CATEGORY_BIT[category]
 
     def remove_excluded_category(self, category: MarketCategory) -> None:
         """Remove a category from exclusion list."""
-        self._excluded.discard(category)
+        self._excluded_mask &= ~_CATEGORY_BIT[category]
 
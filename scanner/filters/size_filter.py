@@ -2,7 +2,7 @@
 
 from decimal import Decimal
 
-from scanner.config import ScannerConfig, config as default_config
+from scanner.config import ScannerConfig, get_config
 from scanner.domain.models import Trade
 from scanner.filters.base import FilterResult, TradeFilter
 
@@ -21,8 +21,8 @@ class SizeFilter(TradeFilter):
         Args:
             config: Scanner configuration. Uses default if not provided.
         """
-        self._config = config or default_config
-        self._min_size = self._config.min_trade_size_usd
+        self._config = config or get_config()
+        self.set_minimum_size(self._config.min_trade_size_usd)
 
     @property
     def name(self) -> str:
@@ -39,14 +39,38 @@ class SizeFilter(TradeFilter):
         Returns:
             FilterResult - rejected if size is below minimum.
         """
-        if trade.size_usd < self._min_size:
+        if self._is_below_min(trade.size_usd_f):
             return FilterResult.reject(
                 f"Trade size ${trade.size_usd:.2f} below minimum ${self._min_size:.2f}"
             )
 
         return FilterResult.accept()
 
+    def check_batch(self, trades: list[Trade]) -> list[FilterResult]:
+        """
+        Check trade sizes for a whole batch in one pass.
+
+        Args:
+            trades: Trades to check.
+
+        Returns:
+            One FilterResult per trade, in the same order.
+        """
+        is_below_min = self._is_below_min
+        return [
+            FilterResult.reject(
+                f"Trade size ${trade.size_usd:.2f} below minimum ${self._min_size:.2f}"
+            )
+            if is_below_min(trade.size_usd_f)
+            else FilterResult.accept()
+            for trade in trades
+        ]
+
     def set_minimum_size(self, size: Decimal) -> None:
         """Update minimum trade size threshold."""
         self._min_size = size
+        self._min_size_f = float(size)
+        # Specialized check bound to the threshold: min > x  <=>  x < min.
+        # Rebuilt only when the threshold changes.
+        self._is_below_min = self._min_size_f.__gt__
 
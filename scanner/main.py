@@ -2,15 +2,17 @@
 
 import asyncio
 import logging
+import queue
 import signal
 import sys
 from decimal import Decimal
+from logging.handlers import QueueHandler, QueueListener
 
 from scanner.config import config
 from scanner.filters import LPFilter, MarketFilter, SizeFilter
 from scanner.output import ConsoleOutput, TelegramOutput
 from scanner.pipeline import Pipeline
-from scanner.services import AlertEnricher, MarketService, WalletService
+from scanner.services import AlertEnricher, MarketService, TickClock, WalletService
 from scanner.signals import (
     ClusteringDetector,
     ContrarianDetector,
@@ -22,22 +24,43 @@ from scanner.signals import (
 from scanner.transport import MockTradeGenerator, PolymarketCLOBClient, PolymarketRESTPoller
 
 
-def setup_logging() -> None:
-    """Configure logging for the application."""
+def setup_logging() -> QueueListener:
+    """
+    Configure logging for the application.
+
+    Records are handed to a queue and written to stdout by a listener
+    thread, so logging never blocks the event loop on terminal I/O.
+
+    Returns:
+        The started listener; stop it on exit to flush pending records.
+    """
     log_format = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
 
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(log_format))
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, stream_handler)
+
+    # The queue handler only merges args into the message; the listener's
+    # handler applies the real format
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
     logging.basicConfig(
         level=getattr(logging, config.log_level.upper()),
-        format=log_format,
         handlers=[
-            logging.StreamHandler(sys.stdout),
+            queue_handler,
         ],
     )
+    listener.start()
 
     # Reduce noise from external libraries
     logging.getLogger("websockets").setLevel(logging.WARNING)
     logging.getLogger("aiohttp").setLevel(logging.WARNING)
 
+    return listener
+
 
 def create_pipeline(use_mock: bool = True) -> Pipeline:
     """
@@ -50,15 +73,16 @@ def create_pipeline(use_mock: bool = True) -> Pipeline:
         Configured Pipeline instance.
     """
     # Create services
-    wallet_service = WalletService()
-    market_service = MarketService()
+    clock = TickClock()
+    wallet_service = WalletService(config, clock=clock)
+    market_service = MarketService(config)
 
     # Create signal detectors
     signal_detectors = [
         FreshWalletDetector(config),
         SizeAnomalyDetector(config),
         TimingDetector(),
-        OddsMovementDetector(),
+        OddsMovementDetector(clock=clock),
         ContrarianDetector(),
         ClusteringDetector(config),
     ]
@@ -68,6 +92,7 @@ def create_pipeline(use_mock: bool = True) -> Pipeline:
         wallet_service=wallet_service,
         market_service=market_service,
         signal_detectors=signal_detectors,
+        clock=clock,
     )
 
     # Create filters
@@ -119,6 +144,7 @@ def create_pipeline(use_mock: bool = True) -> Pipeline:
         filters=filters,
         enricher=enricher,
         outputs=outputs,
+        clock=clock,
     )
 
 
@@ -197,7 +223,7 @@ async def run_scanner(use_mock: bool = True) -> None:
 
 def main() -> None:
     """Main entry point."""
-    setup_logging()
+    log_listener = setup_logging()
 
     # Check for --live flag
     use_mock = "--live" not in sys.argv
@@ -206,6 +232,8 @@ def main() -> None:
         asyncio.run(run_scanner(use_mock=use_mock))
     except KeyboardInterrupt:
         print("\nShutdown complete.")
+    finally:
+        log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -1,12 +1,13 @@
 """Output module - formatters and handlers for alerts."""
 
-from scanner.output.base import AlertOutput
+from scanner.output.base import AlertOutput, FormatContext
 from scanner.output.console import ConsoleOutput
 from scanner.output.telegram import TelegramOutput
 
 __all__ = [
     "AlertOutput",
     "ConsoleOutput",
+    "FormatContext",
     "TelegramOutput",
 ]
 
@@ -1,23 +1,61 @@
 """Base output interface."""
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from decimal import Decimal
 
 from scanner.domain.models import Alert
 
 
+@dataclass(frozen=True, slots=True)
+class FormatContext:
+    """
+    Display fields derived from an alert, shared by all outputs.
+
+    The pipeline builds one per alert so each output does not recompute
+    them.
+    """
+
+    wallet_short: str
+    odds_change: Decimal
+    odds_change_text: str
+
+    @classmethod
+    def from_alert(cls, alert: Alert) -> "FormatContext":
+        """Derive display fields from an alert."""
+        wallet = alert.trade.wallet_address
+        odds_change = alert.odds_after - alert.odds_before
+        return cls(
+            wallet_short=f"{wallet[:6]}...{wallet[-4:]}",
+            odds_change=odds_change,
+            odds_change_text=(
+                f"+{odds_change:.1%}" if odds_change > 0 else f"{odds_change:.1%}"
+            ),
+        )
+
+
 class AlertOutput(ABC):
     """Abstract base class for alert outputs."""
 
     @abstractmethod
-    async def send(self, alert: Alert) -> None:
+    async def send(self, alert: Alert, ctx: FormatContext | None = None) -> None:
         """
         Send an alert to the output destination.
 
         Args:
             alert: Alert to output.
+            ctx: Shared display fields. Built from the alert if not provided.
         """
         ...
 
+    async def start(self) -> None:
+        """Prepare the output (e.g. open connections) before alerts arrive. No-op by default."""
+        return None
+
+    async def close(self) -> None:
+        """Flush pending alerts and release resources. No-op by default."""
+        return None
+
     @property
     def enabled(self) -> bool:
         """Whether output is enabled."""
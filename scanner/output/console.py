@@ -1,17 +1,34 @@
 """Console output for alerts."""
 
+import asyncio
 import logging
+import sys
 from datetime import datetime
 
-from scanner.domain.models import Alert
-from scanner.output.base import AlertOutput
+from scanner.domain.models import Alert, TradeSide
+from scanner.output.base import AlertOutput, FormatContext
+
+
+# Buffered alerts are written out at least this often, in seconds
+FLUSH_INTERVAL = 1.0
+
+# ...or as soon as this many alerts are waiting
+FLUSH_MAX_ALERTS = 100
+
+# Logger used when use_logger is set. Its records propagate to the root
+# handlers, which hand them to main's queue listener, so logging an alert
+# never writes to the terminal from the event loop.
+ALERT_LOGGER_NAME = "scanner.alerts"
 
 
 class ConsoleOutput(AlertOutput):
     """
     Output alerts to console with structured formatting.
 
-    Provides both human-readable and structured log formats.
+    Provides both human-readable and structured log formats. Printed alerts
+    are buffered and written in batches (see FLUSH_INTERVAL /
+    FLUSH_MAX_ALERTS) instead of one write per alert; logged alerts go
+    through the application's logging queue.
     """
 
     # ANSI color codes for terminal
@@ -26,6 +43,9 @@ class ConsoleOutput(AlertOutput):
         "cyan": "\033[96m",
     }
 
+    # "{code}{}{reset}" per color, so _color() is a lookup plus str.format
+    _COLOR_FORMATS = {name: f"{code}{{}}\033[0m" for name, code in COLORS.items()}
+
     def __init__(self, use_colors: bool = True, use_logger: bool = False):
         """
         Initialize console output.
@@ -36,117 +56,192 @@ class ConsoleOutput(AlertOutput):
         """
         self._use_colors = use_colors
         self._use_logger = use_logger
+        self._specialize()
+        self._pending: list[str] = []
+        self._flush_task: asyncio.Task | None = None
 
         if use_logger:
-            self._logger = logging.getLogger("scanner.alerts")
+            self._logger = logging.getLogger(ALERT_LOGGER_NAME)
 
     def _color(self, text: str, color: str) -> str:
         """Apply color to text if colors enabled."""
         if not self._use_colors:
             return text
-        return f"{self.COLORS.get(color, '')}{text}{self.COLORS['reset']}"
+        return self._COLOR_FORMATS.get(color, "{}\033[0m").format(text)
 
-    async def send(self, alert: Alert) -> None:
+    async def send(self, alert: Alert, ctx: FormatContext | None = None) -> None:
         """
         Output alert to console.
 
         Args:
             alert: Alert to display.
+            ctx: Shared display fields. Built from the alert if not provided.
         """
-        output = self._format_alert(alert)
+        output = self._format_alert(alert, ctx)
 
         if self._use_logger:
             self._logger.info(output)
-        else:
-            print(output)
-
-    def _format_alert(self, alert: Alert) -> str:
+            return
+
+        self._pending.append(output)
+        if len(self._pending) >= FLUSH_MAX_ALERTS:
+            self._flush()
+            return
+
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        """Flush buffered alerts after FLUSH_INTERVAL."""
+        try:
+            await asyncio.sleep(FLUSH_INTERVAL)
+        finally:
+            self._flush_task = None
+        self._flush()
+
+    def _flush(self) -> None:
+        """Write all buffered alerts in a single write."""
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+        stream = sys.stdout
+        stream.write("\n".join(pending) + "\n")
+        stream.flush()
+
+    async def close(self) -> None:
+        """Write out any buffered alerts."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._flush()
+
+    def _specialize(self) -> None:
         """
-        Format alert for console display.
+        Prebuild the alert template and colored fragment formats.
 
-        Args:
-            alert: Alert to format.
+        Colors are fixed at init, so ANSI codes (or nothing) are baked into
+        format strings once and per-alert formatting never calls _color().
+        """
+        self._template = self._build_template()
+        self._side_display = {
+            TradeSide.YES: self._color("YES ↑", "green"),
+            TradeSide.NO: self._color("NO ↓", "red"),
+        }
+        self._fresh_wallet_format = "{} " + self._color("[FRESH]", "red")
+        self._no_signals = self._color("None", "yellow")
+        self._signal_format = self._color("{} ({:.0%})", "magenta")
+        self._odds_up_format = self._color("{}", "green")
+        self._odds_down_format = self._color("{}", "red")
+        self._confidence_high_format = self._color("🔥 {:.0%} HIGH", "red")
+        self._confidence_medium_format = self._color("⚡ {:.0%} MEDIUM", "yellow")
+        self._confidence_low_format = self._color("💡 {:.0%} LOW", "blue")
+
+    def _build_template(self) -> str:
+        """
+        Build the alert template once, with static labels already colored.
 
         Returns:
-            Formatted string.
+            ``str.format`` template for _format_alert().
         """
         lines = [
             "",
             self._color("=" * 60, "cyan"),
-            self._color("[ALERT]", "bold") + f" {alert.timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
+            self._color("[ALERT]", "bold") + " {timestamp:%Y-%m-%d %H:%M:%S}",
             self._color("=" * 60, "cyan"),
             "",
-            f"  {self._color('Market:', 'yellow')} {alert.market.question}",
-            f"  {self._color('Category:', 'yellow')} {alert.market.category.value}",
+            f"  {self._color('Market:', 'yellow')} {{question}}",
+            f"  {self._color('Category:', 'yellow')} {{category}}",
             "",
-            f"  {self._color('Wallet:', 'yellow')} {self._format_wallet(alert)}",
-            f"  {self._color('Trade size:', 'yellow')} ${alert.trade.size_usd:,.2f}",
-            f"  {self._color('Side:', 'yellow')} {self._format_side(alert)}",
-            f"  {self._color('Price:', 'yellow')} {alert.trade.price:.2%}",
+            f"  {self._color('Wallet:', 'yellow')} {{wallet}}",
+            f"  {self._color('Trade size:', 'yellow')} ${{size:,.2f}}",
+            f"  {self._color('Side:', 'yellow')} {{side}}",
+            f"  {self._color('Price:', 'yellow')} {{price:.2%}}",
             "",
-            f"  {self._color('Signals:', 'magenta')} {self._format_signals(alert)}",
+            f"  {self._color('Signals:', 'magenta')} {{signals}}",
             "",
-            f"  {self._color('Odds before:', 'blue')} {alert.odds_before:.1%}",
-            f"  {self._color('Odds after:', 'blue')} {alert.odds_after:.1%}",
-            f"  {self._color('Odds change:', 'blue')} {self._format_odds_change(alert)}",
+            f"  {self._color('Odds before:', 'blue')} {{odds_before:.1%}}",
+            f"  {self._color('Odds after:', 'blue')} {{odds_after:.1%}}",
+            f"  {self._color('Odds change:', 'blue')} {{odds_change}}",
             "",
             f"  {self._color('Wallet profile:', 'cyan')}",
-            f"    Total trades: {alert.wallet_profile.total_trades}",
-            f"    Win rate: {alert.wallet_profile.win_rate:.1%}",
-            f"    Avg trade size: ${alert.wallet_profile.avg_trade_size:,.2f}",
+            "    Total trades: {total_trades}",
+            "    Win rate: {win_rate:.1%}",
+            "    Avg trade size: ${avg_size:,.2f}",
             "",
-            f"  {self._color('Confidence score:', 'green')} "
-            f"{self._format_confidence(alert.confidence_score)}",
+            f"  {self._color('Confidence score:', 'green')} {{confidence}}",
             "",
             self._color("-" * 60, "cyan"),
         ]
 
         return "\n".join(lines)
 
-    def _format_wallet(self, alert: Alert) -> str:
-        """Format wallet address with fresh indicator."""
-        wallet = alert.trade.wallet_address
-        short = f"{wallet[:6]}...{wallet[-4:]}"
+    def _format_alert(self, alert: Alert, ctx: FormatContext | None = None) -> str:
+        """
+        Format alert for console display.
 
-        if alert.wallet_profile.is_fresh:
-            return f"{short} {self._color('[FRESH]', 'red')}"
-        return short
+        Args:
+            alert: Alert to format.
+            ctx: Shared display fields. Built from the alert if not provided.
 
-    def _format_side(self, alert: Alert) -> str:
-        """Format trade side with color."""
-        if alert.trade.side.value == "YES":
-            return self._color("YES ↑", "green")
-        return self._color("NO ↓", "red")
+        Returns:
+            Formatted string.
+        """
+        ctx = ctx or FormatContext.from_alert(alert)
+        trade = alert.trade
+        market = alert.market
+        wallet_profile = alert.wallet_profile
+
+        return self._template.format(
+            timestamp=alert.timestamp,
+            question=market.question,
+            category=market.category.value,
+            wallet=self._format_wallet(alert, ctx),
+            size=trade.size_usd,
+            side=self._side_display[trade.side],
+            price=trade.price,
+            signals=self._format_signals(alert),
+            odds_before=alert.odds_before,
+            odds_after=alert.odds_after,
+            odds_change=self._format_odds_change(ctx),
+            total_trades=wallet_profile.total_trades,
+            win_rate=wallet_profile.win_rate,
+            avg_size=wallet_profile.avg_trade_size,
+            confidence=self._format_confidence(alert.confidence_score),
+        )
+
+    def _format_wallet(self, alert: Alert, ctx: FormatContext) -> str:
+        """Format wallet address with fresh indicator."""
+        if alert.wallet_profile.is_fresh:
+            return self._fresh_wallet_format.format(ctx.wallet_short)
+        return ctx.wallet_short
 
     def _format_signals(self, alert: Alert) -> str:
         """Format signal list."""
         if not alert.signals:
-            return self._color("None", "yellow")
-
-        signal_strs = []
-        for signal in alert.signals:
-            signal_str = f"{signal.type.value} ({signal.confidence:.0%})"
-            signal_strs.append(self._color(signal_str, "magenta"))
+            return self._no_signals
 
-        return ", ".join(signal_strs)
+        signal_format = self._signal_format
+        return ", ".join(
+            signal_format.format(signal.type.value, signal.confidence)
+            for signal in alert.signals
+        )
 
-    def _format_odds_change(self, alert: Alert) -> str:
+    def _format_odds_change(self, ctx: FormatContext) -> str:
         """Format odds change with direction."""
-        change = alert.odds_after - alert.odds_before
+        change = ctx.odds_change
         if change > 0:
-            return self._color(f"+{change:.1%}", "green")
+            return self._odds_up_format.format(ctx.odds_change_text)
         elif change < 0:
-            return self._color(f"{change:.1%}", "red")
+            return self._odds_down_format.format(ctx.odds_change_text)
         return "0%"
 
     def _format_confidence(self, confidence) -> str:
         """Format confidence with color based on level."""
-        pct = f"{confidence:.0%}"
-
         if confidence >= 0.8:
-            return self._color(f"🔥 {pct} HIGH", "red")
+            return self._confidence_high_format.format(confidence)
         elif confidence >= 0.6:
-            return self._color(f"⚡ {pct} MEDIUM", "yellow")
+            return self._confidence_medium_format.format(confidence)
         else:
-            return self._color(f"💡 {pct} LOW", "blue")
+            return self._confidence_low_format.format(confidence)
 
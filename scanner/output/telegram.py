@@ -1,30 +1,127 @@
 """Telegram output for alerts."""
 
+import asyncio
 import logging
+import time
+from bisect import bisect_right
 from decimal import Decimal
 
 from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.enums import ParseMode
 
-from scanner.domain.models import Alert
-from scanner.output.base import AlertOutput
+from scanner.domain.models import Alert, SignalType, TradeSide
+from scanner.output.base import AlertOutput, FormatContext
 
 
 logger = logging.getLogger(__name__)
 
+# Telegram Bot API limits: ~30 messages/s overall, 20 messages/min per group
+GLOBAL_RATE_PER_SEC = 30.0
+CHAT_RATE_PER_MIN = 20.0
+
+# Telegram rejects messages longer than this (in characters)
+MAX_MESSAGE_LENGTH = 4096
+
+# Alerts waiting to be sent; new alerts are dropped once this is reached
+QUEUE_MAX_SIZE = 1000
+
+# Maximum number of queued alerts drained per send cycle
+BATCH_MAX_ALERTS = 10
+
+# How long close() waits for queued alerts to go out, in seconds
+CLOSE_FLUSH_TIMEOUT = 5.0
+
+# Alert message skeleton, built once; only the fields are filled per alert
+_ALERT_TEMPLATE = "\n".join([
+    "=====================\n"
+    "{confidence_emoji} <b>POLYMARKET ALERT</b>",
+    "",
+    "📊 <b>{question}</b>",
+    "📁 {category}",
+    "",
+    "👛 <code>{wallet}</code>",
+    "💰 <b>${size:,.0f}</b>",
+    "📈 {side} @ {price:.1%}",
+    "",
+    "⚡ <b>Сигналы:</b> {signals}",
+    "",
+    "📉 Odds: {odds_before:.1%} → {odds_after:.1%} ({odds_change})",
+    "",
+    "🎯 Confidence: <b>{confidence:.0%}</b>",
+    "",
+    "👤 Wallet stats:",
+    "   • Trades: {total_trades}",
+    "   • Win rate: {win_rate:.0%}",
+    "   • Avg size: ${avg_size:,.0f}",
+])
+
+SIGNAL_EMOJIS = {
+    SignalType.FRESH_WALLET: "🆕",
+    SignalType.SIZE_ANOMALY: "📊",
+    SignalType.TIMING_SIGNAL: "⏰",
+    SignalType.ODDS_MOVEMENT: "📈",
+    SignalType.CONTRARIAN: "🔄",
+    SignalType.TRADE_CLUSTERING: "🎯",
+}
+
+# Confidence emoji by level: below 0.6, below 0.8, and 0.8 or higher
+CONFIDENCE_THRESHOLDS = (Decimal("0.6"), Decimal("0.8"))
+CONFIDENCE_EMOJIS = ("💡", "⚡", "🔥")
+
+
+class _TokenBucket:
+    """Simple token bucket rate limiter for asyncio."""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize bucket.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum number of tokens (burst size).
+        """
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+
+            await asyncio.sleep((1 - self._tokens) / self._rate)
+
 
 class TelegramOutput(AlertOutput):
     """
     Output alerts to Telegram via bot.
 
-    Sends formatted messages to a specified chat.
+    Sends formatted messages to a specified chat. Alerts are queued and
+    sent by a background task, which packs alerts that arrive together into
+    as few messages as possible and respects Telegram rate limits.
     """
 
+    # Translation table for _escape_html (single pass over the text)
+    _HTML_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+    _SIDE_DISPLAY = {TradeSide.YES: "🟢 YES", TradeSide.NO: "🔴 NO"}
+
     def __init__(
         self,
         bot_token: str,
         chat_id: str,
         enabled: bool = True,
+        session: AiohttpSession | None = None,
     ):
         """
         Initialize Telegram output.
@@ -33,11 +130,20 @@ class TelegramOutput(AlertOutput):
             bot_token: Telegram bot token from @BotFather.
             chat_id: Chat ID to send messages to.
             enabled: Whether output is enabled.
+            session: HTTP session to share with other bots. A private one is
+                created (and closed on close()) if not provided.
         """
         self._bot_token = bot_token
         self._chat_id = chat_id
         self._enabled = enabled
         self._bot: Bot | None = None
+        self._session = session
+        self._owns_session = session is None
+        # (trade ID, formatted message) pairs waiting to be sent
+        self._queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue(maxsize=QUEUE_MAX_SIZE)
+        self._consumer_task: asyncio.Task | None = None
+        self._global_bucket = _TokenBucket(GLOBAL_RATE_PER_SEC, GLOBAL_RATE_PER_SEC)
+        self._chat_bucket = _TokenBucket(CHAT_RATE_PER_MIN / 60, CHAT_RATE_PER_MIN)
         
         # Log initialization status
         if not self._bot_token:
@@ -60,129 +166,171 @@ class TelegramOutput(AlertOutput):
     async def _get_bot(self) -> Bot:
         """Get or create bot instance (lazy initialization)."""
         if self._bot is None:
-            self._bot = Bot(token=self._bot_token)
+            if self._session is None:
+                self._session = AiohttpSession()
+            self._bot = Bot(token=self._bot_token, session=self._session)
         return self._bot
 
-    async def send(self, alert: Alert) -> None:
+    async def start(self) -> None:
+        """Warm up the connection to Telegram so the first alert skips DNS/TLS setup."""
+        if not self.enabled:
+            return
+
+        try:
+            bot = await self._get_bot()
+            me = await bot.get_me()
+            logger.info(f"Telegram connection ready (bot: @{me.username})")
+        except Exception as e:
+            logger.warning(f"Telegram warm-up failed: {e}")
+
+    async def send(self, alert: Alert, ctx: FormatContext | None = None) -> None:
         """
-        Send alert to Telegram.
+        Format alert and queue it for sending to Telegram.
+
+        Returns immediately; the message is sent by a background task.
 
         Args:
             alert: Alert to send.
+            ctx: Shared display fields. Built from the alert if not provided.
         """
         if not self.enabled:
             logger.debug("Telegram send skipped - output disabled")
             return
 
+        if self._consumer_task is None:
+            self._consumer_task = asyncio.create_task(self._consume())
+
         try:
-            bot = await self._get_bot()
-            message = self._format_alert(alert)
-            await bot.send_message(
-                chat_id=self._chat_id,
-                text=message,
-                parse_mode=ParseMode.HTML,
-                disable_web_page_preview=True,
-            )
-            logger.info(f"Alert sent to Telegram: {alert.trade.id}")
-        except Exception as e:
-            logger.error(f"Failed to send Telegram message: {e}", exc_info=True)
+            self._queue.put_nowait((alert.trade.id, self._format_alert(alert, ctx)))
+        except asyncio.QueueFull:
+            logger.warning(f"Telegram queue full, dropping alert: {alert.trade.id}")
+
+    async def _consume(self) -> None:
+        """Send queued alerts, batching whatever is waiting."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < BATCH_MAX_ALERTS and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                for message in self._pack_messages([text for _, text in batch]):
+                    await self._chat_bucket.acquire()
+                    await self._global_bucket.acquire()
+                    await self._send_message(message)
+                logger.info(
+                    f"Alerts sent to Telegram: {[trade_id for trade_id, _ in batch]}"
+                )
+            except Exception as e:
+                logger.error(f"Failed to send Telegram message: {e}", exc_info=True)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _pack_messages(self, texts: list[str]) -> list[str]:
+        """
+        Join formatted alerts into as few messages as fit the limit.
+
+        Args:
+            texts: Formatted alerts.
+
+        Returns:
+            Message texts, each at most MAX_MESSAGE_LENGTH characters
+            (unless a single alert is longer on its own).
+        """
+        messages: list[str] = []
+        for text in texts:
+            if messages and len(messages[-1]) + 2 + len(text) <= MAX_MESSAGE_LENGTH:
+                messages[-1] = f"{messages[-1]}\n\n{text}"
+            else:
+                messages.append(text)
+        return messages
+
+    async def _send_message(self, text: str) -> None:
+        """Send a single HTML message to the configured chat."""
+        bot = await self._get_bot()
+        await bot.send_message(
+            chat_id=self._chat_id,
+            text=text,
+            parse_mode=ParseMode.HTML,
+            disable_web_page_preview=True,
+        )
 
-    def _format_alert(self, alert: Alert) -> str:
+    def _format_alert(self, alert: Alert, ctx: FormatContext | None = None) -> str:
         """
         Format alert for Telegram.
 
         Args:
             alert: Alert to format.
+            ctx: Shared display fields. Built from the alert if not provided.
 
         Returns:
             HTML-formatted message string.
         """
-        # Confidence emoji
-        confidence_emoji = self._get_confidence_emoji(alert.confidence_score)
-
-        # Side formatting
-        side_emoji = "🟢" if alert.trade.side.value == "YES" else "🔴"
-        side_text = f"{side_emoji} {alert.trade.side.value}"
+        ctx = ctx or FormatContext.from_alert(alert)
+        trade = alert.trade
+        market = alert.market
+        wallet_profile = alert.wallet_profile
 
         # Fresh wallet indicator
-        wallet_short = f"{alert.trade.wallet_address[:6]}...{alert.trade.wallet_address[-4:]}"
-        wallet_text = f"🆕 {wallet_short}" if alert.wallet_profile.is_fresh else wallet_short
-
-        # Signals formatting
-        signals_text = self._format_signals(alert)
-
-        # Odds change
-        odds_change = alert.odds_after - alert.odds_before
-        odds_change_text = f"+{odds_change:.1%}" if odds_change > 0 else f"{odds_change:.1%}"
-
-        # Build message
-        lines = [
-            "=====================\n"
-            f"{confidence_emoji} <b>POLYMARKET ALERT</b>",
-            "",
-            f"📊 <b>{self._escape_html(alert.market.question)}</b>",
-            f"📁 {alert.market.category.value}",
-            "",
-            f"👛 <code>{wallet_text}</code>",
-            f"💰 <b>${alert.trade.size_usd:,.0f}</b>",
-            f"📈 {side_text} @ {alert.trade.price:.1%}",
-            "",
-            f"⚡ <b>Сигналы:</b> {signals_text}",
-            "",
-            f"📉 Odds: {alert.odds_before:.1%} → {alert.odds_after:.1%} ({odds_change_text})",
-            "",
-            f"🎯 Confidence: <b>{alert.confidence_score:.0%}</b>",
-            "",
-            f"👤 Wallet stats:",
-            f"   • Trades: {alert.wallet_profile.total_trades}",
-            f"   • Win rate: {alert.wallet_profile.win_rate:.0%}",
-            f"   • Avg size: ${alert.wallet_profile.avg_trade_size:,.0f}",
-        ]
-
-        return "\n".join(lines)
+        wallet_short = ctx.wallet_short
+        wallet_text = f"🆕 {wallet_short}" if wallet_profile.is_fresh else wallet_short
+
+        return _ALERT_TEMPLATE.format(
+            confidence_emoji=self._get_confidence_emoji(alert.confidence_score),
+            question=self._escape_html(market.question),
+            category=market.category.value,
+            wallet=wallet_text,
+            size=trade.size_usd,
+            side=self._SIDE_DISPLAY[trade.side],
+            price=trade.price,
+            signals=self._format_signals(alert),
+            odds_before=alert.odds_before,
+            odds_after=alert.odds_after,
+            odds_change=ctx.odds_change_text,
+            confidence=alert.confidence_score,
+            total_trades=wallet_profile.total_trades,
+            win_rate=wallet_profile.win_rate,
+            avg_size=wallet_profile.avg_trade_size,
+        )
 
     def _format_signals(self, alert: Alert) -> str:
         """Format signals list."""
         if not alert.signals:
             return "None"
 
-        signal_emojis = {
-            "FreshWallet": "🆕",
-            "SizeAnomaly": "📊",
-            "TimingSignal": "⏰",
-            "OddsMovement": "📈",
-            "Contrarian": "🔄",
-            "TradeClustering": "🎯",
-        }
-
-        parts = []
-        for signal in alert.signals:
-            emoji = signal_emojis.get(signal.type.value, "⚡")
-            parts.append(f"{emoji}{signal.type.value}")
-
-        return ", ".join(parts)
+        return ", ".join(
+            f"{SIGNAL_EMOJIS.get(signal.type, '⚡')}{signal.type.value}"
+            for signal in alert.signals
+        )
 
     def _get_confidence_emoji(self, confidence: Decimal) -> str:
         """Get emoji based on confidence level."""
-        if confidence >= Decimal("0.8"):
-            return "🔥"
-        elif confidence >= Decimal("0.6"):
-            return "⚡"
-        else:
-            return "💡"
+        return CONFIDENCE_EMOJIS[bisect_right(CONFIDENCE_THRESHOLDS, confidence)]
 
     @staticmethod
     def _escape_html(text: str) -> str:
         """Escape HTML special characters."""
-        return (
-            text.replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-        )
+        return text.translate(TelegramOutput._HTML_TABLE)
 
     async def close(self) -> None:
-        """Close bot session."""
+        """Flush queued alerts (bounded by a timeout) and close bot session."""
+        if self._consumer_task is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=CLOSE_FLUSH_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Dropping {self._queue.qsize()} unsent Telegram alerts on close"
+                )
+            self._consumer_task.cancel()
+            try:
+                await self._consumer_task
+            except asyncio.CancelledError:
+                pass
+            self._consumer_task = None
+
         if self._bot:
-            await self._bot.session.close()
+            if self._owns_session:
+                await self._bot.session.close()
+                self._session = None
             self._bot = None
 
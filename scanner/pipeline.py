@@ -1,17 +1,28 @@
 """Trade processing pipeline."""
 
+import asyncio
 import logging
-from collections.abc import AsyncIterator
+from collections import Counter
+from collections.abc import AsyncIterator, Callable
+from contextlib import suppress
 from typing import Protocol
 
 from scanner.domain.models import Alert, Trade
-from scanner.filters.base import TradeFilter
-from scanner.output.base import AlertOutput
+from scanner.filters.base import FilterResult, TradeFilter
+from scanner.output.base import AlertOutput, FormatContext
+from scanner.services.clock import TickClock
 from scanner.services.enrichment import AlertEnricher
 
 
 logger = logging.getLogger(__name__)
 
+# Filters are re-ordered by observed cost per rejection every N trades
+FILTER_REORDER_INTERVAL = 1000
+
+# Trades buffered between the source and the filters; when full, the source
+# waits until the pipeline catches up
+TRADE_QUEUE_MAX_SIZE = 1024
+
 
 class TradeSource(Protocol):
     """Protocol for trade data sources."""
@@ -28,7 +39,12 @@ class Pipeline:
     Flow:
     Trade Source → Filters → Enrichment → Signal Detection → Output
 
-    Each component is pluggable and can be enabled/disabled.
+    Each component is pluggable and can be enabled/disabled. Pure filters
+    run cheapest first and are periodically re-ordered so that those which
+    reject the most per unit of cost run first. Impure filters act as fixed
+    barriers: pure filters are only re-ordered between them, so the set of
+    filters ahead of an impure one (and the trades it sees) never changes.
+    Adjacent pure filters that are not cheap (cost > 1) run concurrently.
     """
 
     def __init__(
@@ -37,6 +53,7 @@ class Pipeline:
         filters: list[TradeFilter],
         enricher: AlertEnricher,
         outputs: list[AlertOutput],
+        clock: TickClock | None = None,
     ):
         """
         Initialize pipeline.
@@ -46,106 +63,367 @@ class Pipeline:
             filters: List of filters to apply.
             enricher: Alert enricher for signal detection.
             outputs: List of output handlers.
+            clock: Shared clock, ticking while the pipeline runs.
         """
         self._source = source
         self._filters = [f for f in filters if f.enabled]
+        self._sort_pure_filters(lambda f: f.cost)
         self._enricher = enricher
         self._outputs = [o for o in outputs if o.enabled]
+        self._clock = clock
 
         # Statistics
-        self._stats = {
-            "trades_received": 0,
-            "trades_filtered": 0,
-            "alerts_generated": 0,
-            "filter_rejections": {},
-        }
+        self._trades_received = 0
+        self._trades_filtered = 0
+        self._alerts_generated = 0
+        self._filter_rejections: Counter[str] = Counter()
+        self._filter_checks: Counter[str] = Counter()
 
     async def run(self) -> None:
         """
         Run the pipeline, processing trades as they arrive.
 
+        The source is read by a separate task into a bounded queue; all
+        trades queued by the time the pipeline is ready are filtered as one
+        batch, so cheap filters can check them in a single synchronous pass.
+
         This method runs indefinitely until cancelled.
         """
         logger.info("Pipeline started")
         logger.info(f"Active filters: {[f.name for f in self._filters]}")
         logger.info(f"Active outputs: {len(self._outputs)}")
 
+        if self._clock:
+            self._clock.start()
+        await self._start_outputs()
+
+        # None is the end-of-source sentinel put by the reader task
+        queue: asyncio.Queue[Trade | None] = asyncio.Queue(maxsize=TRADE_QUEUE_MAX_SIZE)
+        reader = asyncio.create_task(self._read_source(queue))
         try:
-            async for trade in self._source.trades():
-                await self._process_trade(trade)
+            while True:
+                trades = [await queue.get()]
+                while not queue.empty():
+                    trades.append(queue.get_nowait())
+
+                # The sentinel is the last item the reader ever puts
+                done = trades[-1] is None
+                if done:
+                    trades.pop()
+
+                await self._process_batch(trades)
+
+                if done:
+                    break
+
+            # Surface an error that ended the source
+            await reader
         except Exception as e:
             logger.error(f"Pipeline error: {e}")
             raise
         finally:
+            # Wait for the source to clean up (sessions, sockets) before
+            # closing the rest; gather swallows the cancellation
+            reader.cancel()
+            await asyncio.gather(reader, return_exceptions=True)
             logger.info("Pipeline stopped")
             self._log_stats()
+            await self._close_outputs()
+            await self._enricher.close()
+            if self._clock:
+                await self._clock.stop()
 
-    async def _process_trade(self, trade: Trade) -> None:
+    async def _read_source(self, queue: asyncio.Queue[Trade | None]) -> None:
         """
-        Process a single trade through the pipeline.
+        Read trades from the source into the queue.
 
         Args:
-            trade: Trade to process.
+            queue: Queue to fill; None is put once the source ends.
         """
-        self._stats["trades_received"] += 1
+        cancelled = False
+        try:
+            async for trade in self._source.trades():
+                await queue.put(trade)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            if cancelled:
+                # The pipeline is shutting down and may not drain the queue
+                with suppress(asyncio.QueueFull):
+                    queue.put_nowait(None)
+            else:
+                # The pipeline keeps draining, so no queued trade is dropped
+                await queue.put(None)
 
-        # Apply filters
-        for filter_ in self._filters:
-            try:
-                result = await filter_.check(trade)
-
-                if not result.passed:
-                    self._stats["trades_filtered"] += 1
-                    self._stats["filter_rejections"][filter_.name] = (
-                        self._stats["filter_rejections"].get(filter_.name, 0) + 1
-                    )
-                    logger.debug(
-                        f"Trade {trade.id} rejected by {filter_.name}: {result.reason}"
-                    )
-                    return
+    async def _process_batch(self, trades: list[Trade]) -> None:
+        """
+        Process a batch of trades through the pipeline.
 
-            except Exception as e:
-                logger.error(f"Filter {filter_.name} error: {e}")
-                # Continue with other filters on error
+        Args:
+            trades: Trades to process, in arrival order.
+        """
+        received = self._trades_received
+        self._trades_received += len(trades)
+        if received // FILTER_REORDER_INTERVAL != self._trades_received // FILTER_REORDER_INTERVAL:
+            self._reorder_filters()
+
+        passed = await self._apply_filters(trades)
+        self._trades_filtered += len(trades) - len(passed)
+
+        for trade in passed:
+            await self._process_trade(trade)
 
-        # Trade passed all filters - enrich it
+    async def _process_trade(self, trade: Trade) -> None:
+        """
+        Enrich a trade that passed all filters and send its alert.
+
+        Args:
+            trade: Trade to process.
+        """
         try:
             alert = await self._enricher.enrich(trade)
 
             if alert:
-                self._stats["alerts_generated"] += 1
+                self._alerts_generated += 1
                 await self._send_alert(alert)
 
         except Exception as e:
             logger.error(f"Enrichment error for trade {trade.id}: {e}")
 
+    async def _apply_filters(self, trades: list[Trade]) -> list[Trade]:
+        """
+        Run the filter chain on a batch of trades.
+
+        Filters run in order, each over the trades the previous ones
+        passed; runs of adjacent pure, non-cheap filters are checked
+        concurrently per trade.
+
+        Args:
+            trades: Trades to check.
+
+        Returns:
+            Trades that passed all filters, in their original order.
+        """
+        concurrent: list[TradeFilter] = []
+
+        for filter_ in self._filters:
+            if not trades:
+                return trades
+
+            if filter_.is_pure and filter_.cost > 1:
+                concurrent.append(filter_)
+                continue
+
+            if concurrent:
+                trades = await self._run_filters_concurrently(concurrent, trades)
+                concurrent = []
+
+            trades = await self._run_filter(filter_, trades)
+
+        if concurrent and trades:
+            trades = await self._run_filters_concurrently(concurrent, trades)
+        return trades
+
+    async def _run_filters_concurrently(
+        self,
+        filters: list[TradeFilter],
+        trades: list[Trade],
+    ) -> list[Trade]:
+        """
+        Run filters concurrently on each trade.
+
+        Args:
+            filters: Pure filters to run.
+            trades: Trades to check.
+
+        Returns:
+            Trades that passed all filters.
+        """
+        if len(filters) == 1:
+            return await self._run_filter(filters[0], trades)
+
+        await asyncio.gather(*(self._prefetch(f, trades) for f in filters))
+        return [trade for trade in trades if await self._check_concurrently(filters, trade)]
+
+    async def _check_concurrently(self, filters: list[TradeFilter], trade: Trade) -> bool:
+        """
+        Check one trade with several filters, cancelling the rest on the
+        first rejection.
+
+        Args:
+            filters: Pure filters to run.
+            trade: Trade to check.
+
+        Returns:
+            True if the trade passed all filters.
+        """
+        tasks = [asyncio.create_task(self._check_trade(f, trade)) for f in filters]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                if not await next_done:
+                    return False
+            return True
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _run_filter(self, filter_: TradeFilter, trades: list[Trade]) -> list[Trade]:
+        """
+        Run a single filter over a batch and record its statistics.
+
+        The filter prefetches its data for the batch, then checks it with
+        its synchronous check_batch() when it has one, or by awaiting
+        check() per trade otherwise.
+
+        Args:
+            filter_: Filter to run.
+            trades: Trades to check.
+
+        Returns:
+            Trades the filter passed. Filter errors are logged and treated
+            as a pass.
+        """
+        await self._prefetch(filter_, trades)
+        try:
+            results = filter_.check_batch(trades)
+        except Exception as e:
+            logger.error(f"Filter {filter_.name} error: {e}")
+            return trades
+
+        if results is None:
+            return [trade for trade in trades if await self._check_trade(filter_, trade)]
+
+        self._filter_checks[filter_.name] += len(trades)
+        passed = []
+        for trade, result in zip(trades, results):
+            if result.passed:
+                passed.append(trade)
+            else:
+                self._record_rejection(filter_, trade, result)
+        return passed
+
+    async def _prefetch(self, filter_: TradeFilter, trades: list[Trade]) -> None:
+        """Let a filter load data for a batch; errors are logged and ignored."""
+        try:
+            await filter_.prefetch(trades)
+        except Exception as e:
+            logger.error(f"Filter {filter_.name} prefetch error: {e}")
+
+    async def _check_trade(self, filter_: TradeFilter, trade: Trade) -> bool:
+        """
+        Check a single trade and record the filter's statistics.
+
+        Args:
+            filter_: Filter to run.
+            trade: Trade to check.
+
+        Returns:
+            False if the filter rejected the trade. Filter errors are logged
+            and treated as a pass.
+        """
+        try:
+            result = await filter_.check(trade)
+        except Exception as e:
+            logger.error(f"Filter {filter_.name} error: {e}")
+            # Continue with other filters on error
+            return True
+
+        # Counted only once a result exists, so checks cancelled by a
+        # sibling's rejection do not dilute this filter's reject rate
+        self._filter_checks[filter_.name] += 1
+        if not result.passed:
+            self._record_rejection(filter_, trade, result)
+            return False
+
+        return True
+
+    def _record_rejection(self, filter_: TradeFilter, trade: Trade, result: FilterResult) -> None:
+        """Count a rejection and log its reason."""
+        self._filter_rejections[filter_.name] += 1
+        logger.debug(
+            f"Trade {trade.id} rejected by {filter_.name}: {result.reason}"
+        )
+
+    def _reorder_filters(self) -> None:
+        """Order pure filters by cost per observed rejection, cheapest first."""
+        def cost_per_rejection(filter_: TradeFilter) -> float:
+            checks = self._filter_checks[filter_.name]
+            reject_rate = self._filter_rejections[filter_.name] / checks if checks else 0.0
+            return filter_.cost / max(reject_rate, 0.01)
+
+        self._sort_pure_filters(cost_per_rejection)
+
+    def _sort_pure_filters(self, key: Callable[[TradeFilter], float]) -> None:
+        """
+        Sort each run of pure filters between impure ones, in place.
+
+        An impure filter's result depends on which trades reached it, so no
+        filter is moved across one.
+
+        Args:
+            key: Sort key; lower values run first.
+        """
+        filters = self._filters
+        start = 0
+        for end in range(len(filters) + 1):
+            if end == len(filters) or not filters[end].is_pure:
+                filters[start:end] = sorted(filters[start:end], key=key)
+                start = end + 1
+
     async def _send_alert(self, alert: Alert) -> None:
         """
-        Send alert to all outputs.
+        Send alert to all outputs concurrently.
 
         Args:
             alert: Alert to send.
         """
+        ctx = FormatContext.from_alert(alert)
+        results = await asyncio.gather(
+            *(output.send(alert, ctx) for output in self._outputs),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Output error: {result}")
+
+    async def _start_outputs(self) -> None:
+        """Start all outputs concurrently."""
+        results = await asyncio.gather(
+            *(output.start() for output in self._outputs),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Output start error: {result}")
+
+    async def _close_outputs(self) -> None:
+        """Flush and close all outputs."""
         for output in self._outputs:
             try:
-                await output.send(alert)
+                await output.close()
             except Exception as e:
-                logger.error(f"Output error: {e}")
+                logger.error(f"Output close error: {e}")
 
     def _log_stats(self) -> None:
         """Log pipeline statistics."""
         logger.info("Pipeline statistics:")
-        logger.info(f"  Trades received: {self._stats['trades_received']}")
-        logger.info(f"  Trades filtered: {self._stats['trades_filtered']}")
-        logger.info(f"  Alerts generated: {self._stats['alerts_generated']}")
+        logger.info(f"  Trades received: {self._trades_received}")
+        logger.info(f"  Trades filtered: {self._trades_filtered}")
+        logger.info(f"  Alerts generated: {self._alerts_generated}")
 
-        if self._stats["filter_rejections"]:
+        if self._filter_rejections:
             logger.info("  Filter rejections:")
-            for name, count in self._stats["filter_rejections"].items():
+            for name, count in self._filter_rejections.items():
                 logger.info(f"    {name}: {count}")
 
     @property
     def stats(self) -> dict:
         """Get pipeline statistics."""
-        return self._stats.copy()
+        return {
+            "trades_received": self._trades_received,
+            "trades_filtered": self._trades_filtered,
+            "alerts_generated": self._alerts_generated,
+            "filter_rejections": dict(self._filter_rejections),
+        }
 
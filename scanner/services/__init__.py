@@ -1,5 +1,6 @@
 """Services module - enrichment, market data, wallet profiles."""
 
+from scanner.services.clock import TickClock
 from scanner.services.enrichment import AlertEnricher
 from scanner.services.market_service import MarketService
 from scanner.services.wallet_service import WalletService
@@ -7,6 +8,7 @@ from scanner.services.wallet_service import WalletService
 __all__ = [
     "AlertEnricher",
     "MarketService",
+    "TickClock",
     "WalletService",
 ]
 
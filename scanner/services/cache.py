@@ -0,0 +1,61 @@
+"""Bounded in-memory caches."""
+
+from collections import OrderedDict
+from typing import Generic, TypeVar
+
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Mapping with a fixed capacity that evicts the least recently used entry.
+
+    Both lookups and stores count as a use.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries kept.
+        """
+        self._maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Get a value and mark it as most recently used."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def peek(self, key: K, default: V | None = None) -> V | None:
+        """Get a value without changing its recency."""
+        return self._data.get(key, default)
+
+    def __setitem__(self, key: K, value: V) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of entries kept."""
+        return self._maxsize
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
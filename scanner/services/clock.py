@@ -0,0 +1,55 @@
+"""Coarse wall clock shared by pipeline components."""
+
+import asyncio
+from datetime import datetime
+
+
+class TickClock:
+    """
+    Wall clock refreshed by a background task instead of on every read.
+
+    now() returns the last tick, so hot paths share one datetime object
+    per tick instead of calling datetime.now() per alert. Until start()
+    is called (or after stop()), now() falls back to datetime.now().
+    """
+
+    def __init__(self, resolution: float = 0.05):
+        """
+        Initialize clock.
+
+        Args:
+            resolution: Seconds between ticks.
+        """
+        self._resolution = resolution
+        self._now = datetime.now()
+        self._task: asyncio.Task | None = None
+
+    def now(self) -> datetime:
+        """Get the current time, accurate to about one tick."""
+        if self._task is None:
+            return datetime.now()
+        return self._now
+
+    def start(self) -> None:
+        """Start ticking. Must be called from a running event loop."""
+        if self._task is None:
+            self._now = datetime.now()
+            self._task = asyncio.create_task(self._tick())
+
+    async def stop(self) -> None:
+        """Stop ticking."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _tick(self) -> None:
+        """Refresh the cached time every tick."""
+        while True:
+            await asyncio.sleep(self._resolution)
+            self._now = datetime.now()
@@ -1,12 +1,27 @@
 """Alert enrichment service."""
 
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
 from datetime import datetime
 from decimal import Decimal
 
 from scanner.domain.models import Alert, Market, Signal, Trade, WalletProfile
+from scanner.services.clock import TickClock
 from scanner.services.market_service import MarketService
 from scanner.services.wallet_service import WalletService
-from scanner.signals.base import SignalDetector
+from scanner.signals.base import SignalDetector, to_confidence
+
+
+logger = logging.getLogger(__name__)
+
+# How long a cached detector result is reused, in seconds
+SIGNAL_CACHE_TTL = 5.0
+
+# Maximum number of cached detector results
+SIGNAL_CACHE_MAX_SIZE = 10_000
 
 
 class AlertEnricher:
@@ -25,6 +40,7 @@ class AlertEnricher:
         wallet_service: WalletService,
         market_service: MarketService,
         signal_detectors: list[SignalDetector],
+        clock: TickClock | None = None,
     ):
         """
         Initialize enricher.
@@ -33,11 +49,18 @@ class AlertEnricher:
             wallet_service: Service for wallet data.
             market_service: Service for market data.
             signal_detectors: List of signal detectors to run.
+            clock: Clock for alert timestamps. Uses datetime.now if not provided.
         """
+        self._now = clock.now if clock else datetime.now
         self._wallet_service = wallet_service
         self._market_service = market_service
         self._detectors = signal_detectors
 
+        # (detector name, detector cache key) -> (monotonic time, result)
+        self._signal_cache: OrderedDict[
+            tuple[str, Hashable], tuple[float, Signal | None]
+        ] = OrderedDict()
+
     async def enrich(self, trade: Trade) -> Alert | None:
         """
         Enrich a trade into a full alert.
@@ -86,7 +109,7 @@ class AlertEnricher:
             odds_before=odds_before,
             odds_after=odds_after,
             confidence_score=confidence,
-            timestamp=datetime.now(),
+            timestamp=self._now(),
         )
 
     async def _detect_signals(
@@ -95,32 +118,70 @@ class AlertEnricher:
         wallet_profile: WalletProfile,
     ) -> list[Signal]:
         """
-        Run all signal detectors on a trade.
+        Run all signal detectors on a trade concurrently.
 
         Args:
             trade: Trade to analyze.
             wallet_profile: Wallet profile for context.
 
         Returns:
-            List of detected signals.
+            List of detected signals, in detector order.
         """
-        signals = []
-
-        for detector in self._detectors:
-            if not detector.enabled:
-                continue
+        detectors = [d for d in self._detectors if d.enabled]
+        results = await asyncio.gather(
+            *(self._cached_detect(d, trade, wallet_profile) for d in detectors),
+            return_exceptions=True,
+        )
 
-            try:
-                signal = await detector.detect(trade, wallet_profile)
-                if signal:
-                    signals.append(signal)
-            except Exception as e:
+        signals = []
+        for detector, result in zip(detectors, results):
+            if isinstance(result, Exception):
                 # Log but don't fail on detector errors
-                # TODO: Add proper logging
-                print(f"Detector {detector.name} failed: {e}")
+                logger.error("Detector %s failed", detector.name, exc_info=result)
+            elif result:
+                signals.append(result)
 
         return signals
 
+    async def _cached_detect(
+        self,
+        detector: SignalDetector,
+        trade: Trade,
+        wallet_profile: WalletProfile,
+    ) -> Signal | None:
+        """
+        Run a detector, reusing a recent result if the detector allows it.
+
+        Args:
+            detector: Detector to run.
+            trade: Trade to analyze.
+            wallet_profile: Wallet profile for context.
+
+        Returns:
+            Detected signal or None.
+        """
+        key = detector.cache_key(trade, wallet_profile)
+        if key is None:
+            return await detector.detect(trade, wallet_profile)
+
+        cache = self._signal_cache
+        cache_key = (detector.name, key)
+        now = time.monotonic()
+
+        cached = cache.get(cache_key)
+        if cached is not None and now - cached[0] < SIGNAL_CACHE_TTL:
+            cache.move_to_end(cache_key)
+            return cached[1]
+
+        signal = await detector.detect(trade, wallet_profile)
+
+        cache[cache_key] = (now, signal)
+        cache.move_to_end(cache_key)
+        if len(cache) > SIGNAL_CACHE_MAX_SIZE:
+            cache.popitem(last=False)
+
+        return signal
+
     def _calculate_confidence(
         self,
         signals: list[Signal],
@@ -143,28 +204,32 @@ class AlertEnricher:
         if not signals:
             return Decimal("0.3")  # Base confidence
 
+        # Scored in floats; converted back to Decimal once at the end
+
         # Average signal confidence
-        avg_signal_conf = sum(s.confidence for s in signals) / len(signals)
+        avg_signal_conf = sum(float(s.confidence) for s in signals) / len(signals)
 
         # Boost for multiple signals
-        signal_count_boost = min(
-            Decimal("0.1") * (len(signals) - 1),
-            Decimal("0.2"),
-        )
+        signal_count_boost = min(0.1 * (len(signals) - 1), 0.2)
 
         # Boost for large trades
-        size_boost = Decimal("0")
-        if trade.size_usd >= Decimal("10000"):
-            size_boost = Decimal("0.05")
-        if trade.size_usd >= Decimal("50000"):
-            size_boost = Decimal("0.1")
+        size_usd = trade.size_usd_f
+        size_boost = 0.0
+        if size_usd >= 10000:
+            size_boost = 0.05
+        if size_usd >= 50000:
+            size_boost = 0.1
 
         # Boost for fresh wallets with high win rate (if known)
-        winrate_boost = Decimal("0")
+        winrate_boost = 0.0
         if wallet_profile.win_rate >= Decimal("0.6") and wallet_profile.total_trades >= 10:
-            winrate_boost = Decimal("0.1")
+            winrate_boost = 0.1
 
         confidence = avg_signal_conf + signal_count_boost + size_boost + winrate_boost
 
-        return min(confidence, Decimal("0.99"))
+        return to_confidence(min(confidence, 0.99))
+
+    async def close(self) -> None:
+        """Release network resources held by the services."""
+        await self._market_service.close()
 
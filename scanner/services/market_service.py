@@ -1,18 +1,34 @@
 """Market data service."""
 
+import asyncio
 import logging
 import re
+from collections.abc import Coroutine, Iterable
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any
 
 import aiohttp
 
+from scanner import _json
+from scanner._keywords import build_keyword_matcher
+from scanner.config import ScannerConfig, get_config
 from scanner.domain.models import Market, MarketCategory
+from scanner.services.cache import LRUCache
+from scanner.transport._http import create_session
 
 
 logger = logging.getLogger(__name__)
 
+# Markets requested per bulk Gamma API call, and concurrent single fetches
+# for markets a bulk call did not return
+MARKET_BATCH_SIZE = 50
+MARKET_FETCH_CONCURRENCY = 10
+
+# Number of distinct (question, tags) pairs whose category is memoized
+CATEGORY_CACHE_MAX_SIZE = 4096
+
 # Keywords for category detection
 CATEGORY_KEYWORDS: dict[MarketCategory, list[str]] = {
     MarketCategory.CRYPTO: [
@@ -61,21 +77,115 @@ CATEGORY_KEYWORDS: dict[MarketCategory, list[str]] = {
     ],
 }
 
+# Polymarket tags (lowercased) that decide the category without a keyword scan
+TAG_TO_CATEGORY: dict[str, MarketCategory] = {
+    "politics": MarketCategory.POLITICS,
+    "elections": MarketCategory.POLITICS,
+    "sports": MarketCategory.SPORTS,
+    "crypto": MarketCategory.CRYPTO,
+    "pop culture": MarketCategory.ENTERTAINMENT,
+    "entertainment": MarketCategory.ENTERTAINMENT,
+    "science": MarketCategory.SCIENCE,
+    "economics": MarketCategory.ECONOMICS,
+    "economy": MarketCategory.ECONOMICS,
+    "finance": MarketCategory.ECONOMICS,
+}
+
+# Gamma API market ``category`` values (lowercased, dashes as spaces) that
+# decide the category; the tag vocabulary plus Gamma-only labels
+GAMMA_CATEGORY_MAP: dict[str, MarketCategory] = {
+    **TAG_TO_CATEGORY,
+    "us current affairs": MarketCategory.POLITICS,
+    "global politics": MarketCategory.POLITICS,
+    "business": MarketCategory.ECONOMICS,
+}
+
+# Keyword -> (category, score); short keywords must match whole words and score higher
+_KEYWORD_SCORES: dict[str, tuple[MarketCategory, int]] = {
+    keyword: (category, 2 if len(keyword) <= 4 else 1)
+    for category, keywords in CATEGORY_KEYWORDS.items()
+    for keyword in keywords
+}
+
+# All short keywords as one word-bounded alternation, longest first. Matched
+# against already-lowercased text, so no IGNORECASE: every match is then
+# exactly a keyword
+_SHORT_KEYWORD_RE = re.compile(
+    r"\b(?:"
+    + "|".join(
+        re.escape(k)
+        for k in sorted((k for k in _KEYWORD_SCORES if len(k) <= 4), key=len, reverse=True)
+    )
+    + r")\b"
+)
+
+
+# Long keywords match as plain substrings
+_match_long_keywords = build_keyword_matcher(k for k in _KEYWORD_SCORES if len(k) > 4)
+
+
+@lru_cache(maxsize=CATEGORY_CACHE_MAX_SIZE)
+def _detect_category_cached(question: str, tags: tuple[str, ...]) -> MarketCategory:
+    """
+    Detect category from a known tag, else by scoring category keywords.
+
+    Memoized, since the same market question is parsed repeatedly.
+
+    Args:
+        question: Market question/description.
+        tags: Tags from API.
+
+    Returns:
+        Detected MarketCategory.
+    """
+    # An authoritative tag wins outright; the first one listed decides
+    for tag in tags:
+        category = TAG_TO_CATEGORY.get(tag.strip().lower())
+        if category is not None:
+            return category
+
+    text = (question + " " + " ".join(tags)).lower()
+
+    # Each keyword scores once, however often it occurs
+    matched = {m.group(0) for m in _SHORT_KEYWORD_RE.finditer(text)}
+    matched.update(keyword for _, keyword in _match_long_keywords(text))
+
+    category_scores = dict.fromkeys(CATEGORY_KEYWORDS, 0)
+    for keyword in matched:
+        category, score = _KEYWORD_SCORES[keyword]
+        category_scores[category] += score
+
+    # Return category with highest score; ties go to the earlier category
+    best = max(category_scores, key=category_scores.__getitem__)
+    if category_scores[best]:
+        return best
+
+    return MarketCategory.OTHER
+
 
 class MarketService:
     """
     Service for fetching and caching market data from Polymarket APIs.
     
     Uses Gamma API for market metadata and CLOB API for trading data.
+    Concurrent lookups of the same uncached market share a single fetch.
     """
 
     GAMMA_API = "https://gamma-api.polymarket.com"
     CLOB_API = "https://clob.polymarket.com"
 
-    def __init__(self):
-        """Initialize market service."""
-        self._cache: dict[str, Market] = {}
+    def __init__(self, config: ScannerConfig | None = None):
+        """
+        Initialize market service.
+
+        Args:
+            config: Scanner configuration. Uses default if not provided.
+        """
+        self._config = config or get_config()
+        self._cache: LRUCache[str, Market] = LRUCache(self._config.market_cache_size)
+        self._inflight: dict[str, asyncio.Task[Market | None]] = {}
         self._condition_to_market: dict[str, str] = {}
+        self._session: aiohttp.ClientSession | None = None
 
     async def get_market(self, market_id: str, raw_data: dict[str, Any] | None = None) -> Market | None:
         """
@@ -88,23 +198,152 @@ class MarketService:
         Returns:
             Market data or None if not found.
         """
-        if market_id in self._cache:
-            return self._cache[market_id]
+        market = self._cache.get(market_id)
+        if market is not None:
+            return market
 
-        # Try to extract market info from raw WebSocket data first
+        # Share one load per market between concurrent callers
+        load = self._inflight.get(market_id)
+        if load is None:
+            load = self._start_load(market_id, self._load_market(market_id, raw_data))
+
+        # Shielded so that a cancelled caller does not abort the shared load
+        return await asyncio.shield(load)
+
+    async def get_markets(
+        self,
+        market_ids: Iterable[str],
+        raw_data: dict[str, dict[str, Any] | None] | None = None,
+    ) -> dict[str, Market | None]:
+        """
+        Get data for several markets, fetching uncached ones in bulk.
+
+        Markets without attached market_info are requested from the Gamma API
+        in batches of MARKET_BATCH_SIZE condition IDs, and each batched ID is
+        registered as in flight until its batch returns. Markets a batch does
+        not return are looked up one by one, at most MARKET_FETCH_CONCURRENCY
+        at a time.
+
+        Args:
+            market_ids: Market IDs to lookup.
+            raw_data: Optional raw trade data per market ID.
+
+        Returns:
+            Market data (or None if not found) per requested market ID.
+        """
+        raw_data = raw_data or {}
+        unique_ids = list(dict.fromkeys(market_ids))
+        results: dict[str, Market | None] = {}
+
+        to_batch = []
+        for market_id in unique_ids:
+            market = self._cache.get(market_id)
+            if market is not None:
+                results[market_id] = market
+                continue
+            raw = raw_data.get(market_id)
+            # Embedded market info and loads already in flight need no request
+            if market_id not in self._inflight and not (raw and "market_info" in raw):
+                to_batch.append(market_id)
+
+        # Register each batched ID as in flight so concurrent get_market
+        # calls wait for the batch instead of requesting the market again
+        semaphore = asyncio.Semaphore(MARKET_FETCH_CONCURRENCY)
+        for i in range(0, len(to_batch), MARKET_BATCH_SIZE):
+            chunk = to_batch[i:i + MARKET_BATCH_SIZE]
+            batch = asyncio.create_task(self._fetch_market_batch(chunk))
+            for market_id in chunk:
+                self._start_load(market_id, self._load_from_batch(market_id, batch, semaphore))
+
+        async def fetch_one(market_id: str) -> Market | None:
+            # Loads already in flight take no slot: batched ones acquire the
+            # semaphore themselves if they have to fall back
+            load = self._inflight.get(market_id)
+            if load is not None:
+                return await asyncio.shield(load)
+            async with semaphore:
+                return await self.get_market(market_id, raw_data=raw_data.get(market_id))
+
+        remaining = [market_id for market_id in unique_ids if market_id not in results]
+        markets = await asyncio.gather(*(fetch_one(m) for m in remaining))
+        results.update(zip(remaining, markets))
+
+        return results
+
+    async def _load_market(
+        self,
+        market_id: str,
+        raw_data: dict[str, Any] | None,
+    ) -> Market | None:
+        """
+        Load a market from raw trade data or the API and cache it.
+
+        Args:
+            market_id: Market ID to load.
+            raw_data: Optional raw trade data with market_info.
+
+        Returns:
+            Market data or None if not found.
+        """
         market = None
+
+        # Try to extract market info from raw WebSocket data first
         if raw_data and "market_info" in raw_data:
             market = self._parse_market_info(market_id, raw_data["market_info"])
-        
+
         # If no market info in raw_data, fetch from API
         if not market:
             market = await self._fetch_market(market_id)
-        
+
         if market:
             self._cache[market_id] = market
 
         return market
 
+    async def _load_from_batch(
+        self,
+        market_id: str,
+        batch: asyncio.Task[dict[str, Market]],
+        semaphore: asyncio.Semaphore,
+    ) -> Market | None:
+        """
+        Take a market from a bulk request, fetching it alone if it is missing.
+
+        Args:
+            market_id: Market ID to load.
+            batch: Bulk request that includes market_id.
+            semaphore: Limits concurrent single-market fallback requests.
+
+        Returns:
+            Market data or None if not found.
+        """
+        # Shielded so that cancelling one load does not abort the whole batch
+        market = (await asyncio.shield(batch)).get(market_id)
+        if market is None:
+            async with semaphore:
+                market = await self._fetch_market(market_id)
+
+        if market:
+            self._cache[market_id] = market
+
+        return market
+
+    def _start_load(
+        self,
+        market_id: str,
+        load: Coroutine[Any, Any, Market | None],
+    ) -> asyncio.Task[Market | None]:
+        """Run a market load as a task registered in the in-flight map."""
+        task = asyncio.create_task(load)
+        self._inflight[market_id] = task
+        task.add_done_callback(lambda done: self._forget_load(market_id, done))
+        return task
+
+    def _forget_load(self, market_id: str, task: asyncio.Task) -> None:
+        """Drop a finished load from the in-flight map."""
+        if self._inflight.get(market_id) is task:
+            del self._inflight[market_id]
+
     def _parse_market_info(self, market_id: str, market_info: dict[str, Any]) -> Market | None:
         """
         Parse market info from WebSocket cached data.
@@ -133,15 +372,22 @@ class MarketService:
             if isinstance(tags, str):
                 tags = [tags]
             
-            # Determine category
-            category = self._detect_category(question, tags)
+            # Determine category, trusting Gamma's own category when known
+            category = None
+            gamma_category = market_info.get("category")
+            if isinstance(gamma_category, str):
+                category = GAMMA_CATEGORY_MAP.get(
+                    gamma_category.strip().lower().replace("-", " ")
+                )
+            if category is None:
+                category = self._detect_category(question, tags)
             
             # Parse end date
             end_date = None
             end_date_str = market_info.get("endDate") or market_info.get("end_date_iso")
             if end_date_str:
                 try:
-                    end_date = datetime.fromisoformat(end_date_str.replace("Z", "+00:00"))
+                    end_date = datetime.fromisoformat(end_date_str)
                 except (ValueError, TypeError):
                     pass
             
@@ -183,6 +429,18 @@ class MarketService:
             logger.warning(f"Failed to parse market info for {market_id}: {e}")
             return None
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the shared aiohttp session."""
+        if self._session is None or self._session.closed:
+            self._session = create_session()
+        return self._session
+
+    async def close(self) -> None:
+        """Close the HTTP session."""
+        if self._session:
+            await self._session.close()
+            self._session = None
+
     async def _fetch_market(self, market_id: str) -> Market | None:
         """
         Fetch market data from Polymarket Gamma API.
@@ -193,45 +451,82 @@ class MarketService:
         Returns:
             Market data or None.
         """
-        async with aiohttp.ClientSession() as session:
-            # Try Gamma API first (has more metadata)
-            try:
-                # First try to get by condition_id
-                url = f"{self.GAMMA_API}/markets?condition_id={market_id}"
-                logger.debug(f"Fetching market from {url}")
-                
-                async with session.get(url) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        if data and len(data) > 0:
-                            return self._parse_market_info(market_id, data[0])
-                
-                # Try by slug as fallback
-                url = f"{self.GAMMA_API}/markets/{market_id}"
-                async with session.get(url) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        if data:
-                            return self._parse_market_info(market_id, data)
-                            
-            except Exception as e:
-                logger.warning(f"Gamma API request failed for {market_id}: {e}")
+        session = await self._get_session()
+
+        # Try Gamma API first (has more metadata)
+        try:
+            # First try to get by condition_id
+            url = f"{self.GAMMA_API}/markets?condition_id={market_id}"
+            logger.debug(f"Fetching market from {url}")
             
-            # Try CLOB API as fallback
-            try:
-                url = f"{self.CLOB_API}/markets/{market_id}"
-                async with session.get(url) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        if data:
-                            return self._parse_market_info(market_id, data)
-                            
-            except Exception as e:
-                logger.warning(f"CLOB API request failed for {market_id}: {e}")
+            async with session.get(url) as resp:
+                if resp.status == 200:
+                    data = _json.loads(await resp.read())
+                    if data and len(data) > 0:
+                        return self._parse_market_info(market_id, data[0])
+            
+            # Try by slug as fallback
+            url = f"{self.GAMMA_API}/markets/{market_id}"
+            async with session.get(url) as resp:
+                if resp.status == 200:
+                    data = _json.loads(await resp.read())
+                    if data:
+                        return self._parse_market_info(market_id, data)
+                        
+        except Exception as e:
+            logger.warning(f"Gamma API request failed for {market_id}: {e}")
+        
+        # Try CLOB API as fallback
+        try:
+            url = f"{self.CLOB_API}/markets/{market_id}"
+            async with session.get(url) as resp:
+                if resp.status == 200:
+                    data = _json.loads(await resp.read())
+                    if data:
+                        return self._parse_market_info(market_id, data)
+                        
+        except Exception as e:
+            logger.warning(f"CLOB API request failed for {market_id}: {e}")
         
         logger.warning(f"Could not fetch market data for {market_id}")
         return None
 
+    async def _fetch_market_batch(self, market_ids: list[str]) -> dict[str, Market]:
+        """
+        Fetch several markets by condition ID in one Gamma API request.
+
+        Args:
+            market_ids: Condition IDs to fetch.
+
+        Returns:
+            Parsed markets keyed by condition ID; IDs not found are omitted.
+        """
+        session = await self._get_session()
+        params = [("condition_ids", market_id) for market_id in market_ids]
+
+        try:
+            async with session.get(f"{self.GAMMA_API}/markets", params=params) as resp:
+                if resp.status != 200:
+                    return {}
+                data = _json.loads(await resp.read())
+        except Exception as e:
+            logger.warning(f"Gamma API batch request failed for {len(market_ids)} markets: {e}")
+            return {}
+
+        if not isinstance(data, list):
+            return {}
+
+        wanted = set(market_ids)
+        markets: dict[str, Market] = {}
+        for market_info in data:
+            market_id = market_info.get("conditionId") or market_info.get("condition_id")
+            if market_id in wanted:
+                market = self._parse_market_info(market_id, market_info)
+                if market:
+                    markets[market_id] = market
+
+        return markets
+
     def _detect_category(self, question: str, tags: list[str]) -> MarketCategory:
         """
         Detect market category from question text and tags.
@@ -243,31 +538,7 @@ class MarketService:
         Returns:
             Detected MarketCategory.
         """
-        text = (question + " " + " ".join(tags)).lower()
-        
-        # Check for each category by keywords
-        category_scores: dict[MarketCategory, int] = {}
-        
-        for category, keywords in CATEGORY_KEYWORDS.items():
-            score = 0
-            for keyword in keywords:
-                # Use word boundary matching for short keywords
-                if len(keyword) <= 4:
-                    pattern = rf'\b{re.escape(keyword)}\b'
-                    if re.search(pattern, text, re.IGNORECASE):
-                        score += 2
-                else:
-                    if keyword in text:
-                        score += 1
-            
-            if score > 0:
-                category_scores[category] = score
-        
-        if category_scores:
-            # Return category with highest score
-            return max(category_scores, key=category_scores.get)
-        
-        return MarketCategory.OTHER
+        return _detect_category_cached(question, tuple(tags))
 
     async def update_odds(
         self,
@@ -276,28 +547,22 @@ class MarketService:
         odds_no: Decimal,
     ) -> None:
         """
-        Update cached market odds.
+        Update cached market odds in place.
+
+        Trades already holding this market see the new odds as well.
 
         Args:
             market_id: Market to update.
             odds_yes: New YES odds.
             odds_no: New NO odds.
         """
-        if market_id in self._cache:
-            market = self._cache[market_id]
-            self._cache[market_id] = Market(
-                id=market.id,
-                question=market.question,
-                category=market.category,
-                end_date=market.end_date,
-                current_odds_yes=odds_yes,
-                current_odds_no=odds_no,
-                volume_24h=market.volume_24h,
-                liquidity=market.liquidity,
-                metadata=market.metadata,
-            )
+        market = self._cache.peek(market_id)
+        if market is not None:
+            market.current_odds_yes = odds_yes
+            market.current_odds_no = odds_no
 
     def clear_cache(self) -> None:
         """Clear market cache."""
         self._cache.clear()
+        _detect_category_cached.cache_clear()
 
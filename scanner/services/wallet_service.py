@@ -1,22 +1,114 @@
 """Wallet profile service."""
 
+import asyncio
+from dataclasses import dataclass, replace
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 
+from scanner.config import ScannerConfig, get_config
 from scanner.domain.models import WalletProfile
+from scanner.services.cache import LRUCache
+from scanner.services.clock import TickClock
+
+
+# Number of wallets whose mock statistics are memoized
+MOCK_PROFILE_CACHE_SIZE = 50_000
+
+
+@dataclass(frozen=True, slots=True)
+class _MockStats:
+    """Deterministic mock statistics for one wallet."""
+
+    total_trades: int
+    total_volume_usd: Decimal
+    win_rate: Decimal
+    avg_trade_size: Decimal
+    # None for fresh wallets, which are first seen at lookup time
+    first_seen: datetime | None
+    is_suspected_lp: bool
+
+
+@lru_cache(maxsize=MOCK_PROFILE_CACHE_SIZE)
+def _mock_stats(wallet_address: str) -> _MockStats:
+    """
+    Derive mock wallet statistics from the address hash.
+
+    Memoized so a wallet dropped from the profile cache is rebuilt without
+    redoing the arithmetic and Decimal conversions. Only immutable values
+    are cached; profiles themselves are created fresh on every fetch.
+
+    Args:
+        wallet_address: Wallet to describe.
+
+    Returns:
+        Mock statistics for the wallet.
+    """
+    # Use address hash to create deterministic mock data
+    # (str caches its hash, so repeated lookups don't rehash the address)
+    addr_hash = hash(wallet_address)
+
+    # Simulate different wallet types
+    is_fresh = (addr_hash % 10) < 3  # 30% chance of fresh wallet
+    is_whale = (addr_hash % 20) == 0  # 5% chance of whale
+
+    if is_fresh:
+        return _MockStats(
+            total_trades=addr_hash % 5,
+            total_volume_usd=Decimal(addr_hash % 10000),
+            win_rate=Decimal("0.5"),
+            avg_trade_size=Decimal(500 + (addr_hash % 2000)),
+            first_seen=None,
+            is_suspected_lp=False,
+        )
+
+    if is_whale:
+        return _MockStats(
+            total_trades=100 + (addr_hash % 500),
+            total_volume_usd=Decimal(1000000 + (addr_hash % 5000000)),
+            win_rate=Decimal(50 + (addr_hash % 30)) / 100,
+            avg_trade_size=Decimal(10000 + (addr_hash % 50000)),
+            first_seen=datetime(2023, 1, 1),
+            is_suspected_lp=False,
+        )
+
+    # Regular trader
+    return _MockStats(
+        total_trades=10 + (addr_hash % 100),
+        total_volume_usd=Decimal(10000 + (addr_hash % 100000)),
+        win_rate=Decimal(40 + (addr_hash % 20)) / 100,
+        avg_trade_size=Decimal(1000 + (addr_hash % 5000)),
+        first_seen=datetime(2024, 1, 1),
+        is_suspected_lp=(addr_hash % 15) == 0,
+    )
 
 
 class WalletService:
     """
     Service for fetching and caching wallet profiles.
 
+    Concurrent lookups of the same uncached wallet share a single fetch.
+
     TODO: Replace mock implementation with real Polymarket/blockchain API calls.
     """
 
-    def __init__(self):
-        """Initialize wallet service."""
+    def __init__(
+        self,
+        config: ScannerConfig | None = None,
+        clock: TickClock | None = None,
+    ):
+        """
+        Initialize wallet service.
+
+        Args:
+            config: Scanner configuration. Uses default if not provided.
+            clock: Clock for profile timestamps. Uses datetime.now if not provided.
+        """
+        self._config = config or get_config()
+        self._now = clock.now if clock else datetime.now
         # In-memory cache for wallet profiles
-        self._cache: dict[str, WalletProfile] = {}
+        self._cache: LRUCache[str, WalletProfile] = LRUCache(self._config.wallet_cache_size)
+        self._inflight: dict[str, asyncio.Task[WalletProfile]] = {}
 
     async def get_profile(self, wallet_address: str) -> WalletProfile:
         """
@@ -28,9 +120,31 @@ class WalletService:
         Returns:
             WalletProfile with historical data.
         """
-        if wallet_address in self._cache:
-            return self._cache[wallet_address]
+        profile = self._cache.get(wallet_address)
+        if profile is not None:
+            return profile
+
+        # Share one fetch per wallet between concurrent callers, so a late
+        # fetch cannot overwrite a profile already updated by another trade
+        load = self._inflight.get(wallet_address)
+        if load is None:
+            load = asyncio.create_task(self._load_profile(wallet_address))
+            self._inflight[wallet_address] = load
+            load.add_done_callback(lambda task: self._forget_load(wallet_address, task))
+
+        # Shielded so that a cancelled caller does not abort the shared fetch
+        return await asyncio.shield(load)
+
+    async def _load_profile(self, wallet_address: str) -> WalletProfile:
+        """
+        Fetch a wallet profile and cache it.
 
+        Args:
+            wallet_address: Wallet to load.
+
+        Returns:
+            WalletProfile with historical data.
+        """
         # TODO: Fetch real data from Polymarket API or blockchain
         # For now, return a mock profile
         profile = await self._fetch_profile(wallet_address)
@@ -38,6 +152,11 @@ class WalletService:
 
         return profile
 
+    def _forget_load(self, wallet_address: str, task: asyncio.Task) -> None:
+        """Drop a finished fetch from the in-flight map."""
+        if self._inflight.get(wallet_address) is task:
+            del self._inflight[wallet_address]
+
     async def _fetch_profile(self, wallet_address: str) -> WalletProfile:
         """
         Fetch wallet profile from external API.
@@ -55,48 +174,18 @@ class WalletService:
         """
         # MOCK: Generate profile based on address
         # In production, this would be a real API call
+        stats = _mock_stats(wallet_address)
+        now = self._now()
 
-        # Use address hash to create deterministic mock data
-        addr_hash = hash(wallet_address)
-
-        # Simulate different wallet types
-        is_fresh = (addr_hash % 10) < 3  # 30% chance of fresh wallet
-        is_whale = (addr_hash % 20) == 0  # 5% chance of whale
-
-        if is_fresh:
-            return WalletProfile(
-                address=wallet_address,
-                total_trades=addr_hash % 5,
-                total_volume_usd=Decimal(str(addr_hash % 10000)),
-                win_rate=Decimal("0.5"),
-                avg_trade_size=Decimal(str(500 + (addr_hash % 2000))),
-                first_seen=datetime.now(),
-                last_seen=datetime.now(),
-                is_suspected_lp=False,
-            )
-
-        if is_whale:
-            return WalletProfile(
-                address=wallet_address,
-                total_trades=100 + (addr_hash % 500),
-                total_volume_usd=Decimal(str(1000000 + (addr_hash % 5000000))),
-                win_rate=Decimal(str(0.5 + (addr_hash % 30) / 100)),
-                avg_trade_size=Decimal(str(10000 + (addr_hash % 50000))),
-                first_seen=datetime(2023, 1, 1),
-                last_seen=datetime.now(),
-                is_suspected_lp=False,
-            )
-
-        # Regular trader
         return WalletProfile(
             address=wallet_address,
-            total_trades=10 + (addr_hash % 100),
-            total_volume_usd=Decimal(str(10000 + (addr_hash % 100000))),
-            win_rate=Decimal(str(0.4 + (addr_hash % 20) / 100)),
-            avg_trade_size=Decimal(str(1000 + (addr_hash % 5000))),
-            first_seen=datetime(2024, 1, 1),
-            last_seen=datetime.now(),
-            is_suspected_lp=(addr_hash % 15) == 0,
+            total_trades=stats.total_trades,
+            total_volume_usd=stats.total_volume_usd,
+            win_rate=stats.win_rate,
+            avg_trade_size=stats.avg_trade_size,
+            first_seen=stats.first_seen or now,
+            last_seen=now,
+            is_suspected_lp=stats.is_suspected_lp,
         )
 
     async def update_profile(self, wallet_address: str, trade_size: Decimal) -> None:
@@ -107,26 +196,21 @@ class WalletService:
             wallet_address: Wallet that traded.
             trade_size: Size of the trade in USD.
         """
-        if wallet_address not in self._cache:
-            await self.get_profile(wallet_address)
-
-        profile = self._cache[wallet_address]
+        profile = await self.get_profile(wallet_address)
 
         # Update statistics
         new_total = profile.total_trades + 1
         new_volume = profile.total_volume_usd + trade_size
         new_avg = new_volume / Decimal(str(new_total))
 
-        self._cache[wallet_address] = WalletProfile(
-            address=wallet_address,
+        # Replaced rather than mutated: alerts keep the profile as it was
+        # before this trade
+        self._cache[wallet_address] = replace(
+            profile,
             total_trades=new_total,
             total_volume_usd=new_volume,
-            win_rate=profile.win_rate,
             avg_trade_size=new_avg,
-            first_seen=profile.first_seen,
-            last_seen=datetime.now(),
-            preferred_categories=profile.preferred_categories,
-            is_suspected_lp=profile.is_suspected_lp,
+            last_seen=self._now(),
         )
 
     def clear_cache(self) -> None:
@@ -1,10 +1,22 @@
 """Base signal detector interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Hashable
+from decimal import Decimal
 
 from scanner.domain.models import Signal, Trade, WalletProfile
 
 
+def to_confidence(value: float) -> Decimal:
+    """
+    Convert a float confidence into the Decimal stored on signals/alerts.
+
+    Detectors score in plain floats; the value is rounded to 4 places so
+    float noise (0.7999999...) does not leak into the domain model.
+    """
+    return Decimal(f"{value:.4f}")
+
+
 class SignalDetector(ABC):
     """Abstract base class for signal detectors."""
 
@@ -32,6 +44,26 @@ class SignalDetector(ABC):
         """
         ...
 
+    def cache_key(
+        self,
+        trade: Trade,
+        wallet_profile: WalletProfile | None = None,
+    ) -> Hashable | None:
+        """
+        Key under which detect() results may be reused for a short time.
+
+        Only stateless detectors whose result is fully determined by the key
+        should override this. Returns None (no caching) by default.
+
+        Args:
+            trade: Trade to analyze.
+            wallet_profile: Optional wallet profile for context.
+
+        Returns:
+            Hashable cache key, or None if the result must not be cached.
+        """
+        return None
+
     @property
     def enabled(self) -> bool:
         """Whether detector is enabled. Override to disable."""
@@ -1,25 +1,128 @@
 """Trade clustering detector."""
 
-from collections import defaultdict
-from dataclasses import dataclass
+from bisect import insort
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from decimal import Decimal
+from operator import attrgetter
 
-from scanner.config import ScannerConfig, config as default_config
+from scanner.config import ScannerConfig, get_config
 from scanner.domain.models import Signal, SignalType, Trade, TradeSide, WalletProfile
-from scanner.signals.base import SignalDetector
+from scanner.signals.base import SignalDetector, to_confidence
 
 
-@dataclass
+# Sort key for keeping cluster windows in timestamp order
+_trade_time = attrgetter("timestamp")
+
+
+class WalletIdRegistry:
+    """
+    Map wallet addresses to small integer IDs while they are in use.
+
+    IDs are reference counted and recycled once no window holds a trade
+    from the wallet, so the registry only grows with the live windows.
+    """
+
+    def __init__(self):
+        """Initialize empty registry."""
+        self._ids: dict[str, int] = {}
+        self._addresses: list[str | None] = []
+        self._refs: list[int] = []
+        self._free: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def acquire(self, address: str) -> int:
+        """Get the ID for an address and take a reference to it."""
+        wallet_id = self._ids.get(address)
+        if wallet_id is None:
+            if self._free:
+                wallet_id = self._free.pop()
+                self._addresses[wallet_id] = address
+            else:
+                wallet_id = len(self._addresses)
+                self._addresses.append(address)
+                self._refs.append(0)
+            self._ids[address] = wallet_id
+        self._refs[wallet_id] += 1
+        return wallet_id
+
+    def release(self, wallet_id: int) -> None:
+        """Drop a reference; the ID is recycled when none remain."""
+        self._refs[wallet_id] -= 1
+        if not self._refs[wallet_id]:
+            del self._ids[self._addresses[wallet_id]]
+            self._addresses[wallet_id] = None
+            self._free.append(wallet_id)
+
+
+@dataclass(slots=True)
 class ClusterTrade:
     """Trade in a cluster."""
 
-    wallet: str
+    wallet: int
     side: TradeSide
-    size: Decimal
+    size: float
     timestamp: datetime
 
 
+@dataclass(slots=True)
+class ClusterWindow:
+    """
+    Recent trades on one side of one market.
+
+    Distinct wallets (with trade counts) and total volume are updated as
+    trades enter and expire, so checking for a cluster needs no rescans.
+    Wallets are tracked by their registry ID rather than by address.
+    Trades are kept sorted by timestamp, since feeds may deliver them
+    out of order (the Data API returns newest first).
+    """
+
+    registry: WalletIdRegistry
+    trades: deque[ClusterTrade] = field(default_factory=deque)
+    wallet_counts: dict[int, int] = field(default_factory=dict)
+    # Summed in integer micro-dollars so adding and expiring trades never
+    # accumulates float error
+    volume_micros: int = 0
+
+    @property
+    def total_volume(self) -> float:
+        """Total USD volume of trades in the window."""
+        return self.volume_micros / 1_000_000
+
+    def add(self, trade: Trade) -> None:
+        """Add a trade, keeping the window sorted by timestamp."""
+        wallet = self.registry.acquire(trade.wallet_address)
+        cluster_trade = ClusterTrade(
+            wallet=wallet,
+            side=trade.side,
+            size=trade.size_usd_f,
+            timestamp=trade.timestamp,
+        )
+        trades = self.trades
+        if not trades or trades[-1].timestamp <= cluster_trade.timestamp:
+            trades.append(cluster_trade)
+        else:
+            insort(trades, cluster_trade, key=_trade_time)
+        self.wallet_counts[wallet] = self.wallet_counts.get(wallet, 0) + 1
+        self.volume_micros += round(cluster_trade.size * 1_000_000)
+
+    def expire(self, cutoff: datetime) -> None:
+        """Drop trades older than cutoff."""
+        trades = self.trades
+        # The window is sorted, so expired trades are at the front
+        while trades and trades[0].timestamp < cutoff:
+            expired = trades.popleft()
+            remaining = self.wallet_counts[expired.wallet] - 1
+            if remaining:
+                self.wallet_counts[expired.wallet] = remaining
+            else:
+                del self.wallet_counts[expired.wallet]
+            self.registry.release(expired.wallet)
+            self.volume_micros -= round(expired.size * 1_000_000)
+
+
 class ClusteringDetector(SignalDetector):
     """
     Detect trade clustering - multiple wallets trading same direction
@@ -35,25 +138,21 @@ class ClusteringDetector(SignalDetector):
         Args:
             config: Scanner configuration.
         """
-        self._config = config or default_config
+        self._config = config or get_config()
         self._time_window = timedelta(seconds=self._config.clustering_time_window)
         self._min_trades = self._config.clustering_min_trades
 
-        # Track recent trades per market: market_id -> list of cluster trades
-        self._recent_trades: dict[str, list[ClusterTrade]] = defaultdict(list)
+        # Track recent trades per (market_id, side)
+        self._wallet_ids = WalletIdRegistry()
+        self._windows: dict[tuple[str, TradeSide], ClusterWindow] = defaultdict(
+            lambda: ClusterWindow(self._wallet_ids)
+        )
 
     @property
     def name(self) -> str:
         """Detector name."""
         return "ClusteringDetector"
 
-    def _cleanup_old_trades(self, market_id: str, current_time: datetime) -> None:
-        """Remove trades outside the time window."""
-        cutoff = current_time - self._time_window
-        self._recent_trades[market_id] = [
-            t for t in self._recent_trades[market_id] if t.timestamp >= cutoff
-        ]
-
     async def detect(
         self,
         trade: Trade,
@@ -69,47 +168,39 @@ class ClusteringDetector(SignalDetector):
         Returns:
             TradeClustering signal if cluster detected.
         """
-        market_id = trade.market_id
+        # Only trades in the same direction form a cluster
+        window = self._windows[(trade.market_id, trade.side)]
 
-        # Cleanup old trades
-        self._cleanup_old_trades(market_id, trade.timestamp)
+        # Cleanup old trades on both sides of the market; with out-of-order
+        # feeds, the other side may hold trades this one's cutoff expires
+        cutoff = trade.timestamp - self._time_window
+        for side in TradeSide:
+            side_window = self._windows.get((trade.market_id, side))
+            if side_window is not None:
+                side_window.expire(cutoff)
 
         # Add current trade
-        cluster_trade = ClusterTrade(
-            wallet=trade.wallet_address,
-            side=trade.side,
-            size=trade.size_usd,
-            timestamp=trade.timestamp,
-        )
-        self._recent_trades[market_id].append(cluster_trade)
-
-        # Get unique wallets trading same direction
-        same_side = [
-            t for t in self._recent_trades[market_id]
-            if t.side == trade.side
-        ]
+        window.add(trade)
 
-        unique_wallets = set(t.wallet for t in same_side)
-        total_volume = sum(t.size for t in same_side)
+        unique_wallets = len(window.wallet_counts)
+        total_volume = window.total_volume
 
-        if len(unique_wallets) >= self._min_trades:
+        if unique_wallets >= self._min_trades:
             # Cluster detected!
-            time_span = (same_side[-1].timestamp - same_side[0].timestamp).seconds
+            time_span = (window.trades[-1].timestamp - window.trades[0].timestamp).seconds
 
-            confidence = Decimal("0.6") + (
-                Decimal(str(len(unique_wallets))) * Decimal("0.1")
-            )
+            confidence = 0.6 + unique_wallets * 0.1
 
             return Signal(
                 type=SignalType.TRADE_CLUSTERING,
-                confidence=min(confidence, Decimal("0.95")),
+                confidence=to_confidence(min(confidence, 0.95)),
                 description=(
-                    f"{len(unique_wallets)} wallets traded {trade.side.value} "
+                    f"{unique_wallets} wallets traded {trade.side.value} "
                     f"(${total_volume:,.0f}) in {time_span}s"
                 ),
                 metadata={
-                    "unique_wallets": len(unique_wallets),
-                    "total_volume": float(total_volume),
+                    "unique_wallets": unique_wallets,
+                    "total_volume": total_volume,
                     "time_span_seconds": time_span,
                     "side": trade.side.value,
                 },
@@ -119,5 +210,6 @@ class ClusteringDetector(SignalDetector):
 
     def clear_history(self) -> None:
         """Clear trade history."""
-        self._recent_trades.clear()
+        self._windows.clear()
+        self._wallet_ids = WalletIdRegistry()
 
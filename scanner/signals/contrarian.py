@@ -1,9 +1,9 @@
 """Contrarian behavior detector."""
 
-from decimal import Decimal
+from collections.abc import Hashable
 
 from scanner.domain.models import Signal, SignalType, Trade, TradeSide, WalletProfile
-from scanner.signals.base import SignalDetector
+from scanner.signals.base import SignalDetector, to_confidence
 
 
 class ContrarianDetector(SignalDetector):
@@ -16,7 +16,7 @@ class ContrarianDetector(SignalDetector):
     """
 
     # Threshold for considering a position "contrarian"
-    CONTRARIAN_THRESHOLD = Decimal("0.25")  # Betting on <25% odds
+    CONTRARIAN_THRESHOLD = 0.25  # Betting on <25% odds
 
     def __init__(self):
         """Initialize detector."""
@@ -26,6 +26,22 @@ class ContrarianDetector(SignalDetector):
         """Detector name."""
         return "ContrarianDetector"
 
+    def cache_key(
+        self,
+        trade: Trade,
+        wallet_profile: WalletProfile | None = None,
+    ) -> Hashable | None:
+        """Result depends only on the market, its odds and the traded side."""
+        market = trade.market
+        if market is None:
+            return None
+        return (
+            market.id,
+            market.current_odds_yes,
+            market.current_odds_no,
+            trade.side,
+        )
+
     async def detect(
         self,
         trade: Trade,
@@ -45,30 +61,28 @@ class ContrarianDetector(SignalDetector):
             return None
 
         # Get odds for the side being traded
-        if trade.side == TradeSide.YES:
-            odds = trade.market.current_odds_yes
-            opposite_odds = trade.market.current_odds_no
+        if trade.side is TradeSide.YES:
+            odds = float(trade.market.current_odds_yes)
+            opposite_odds = float(trade.market.current_odds_no)
         else:
-            odds = trade.market.current_odds_no
-            opposite_odds = trade.market.current_odds_yes
+            odds = float(trade.market.current_odds_no)
+            opposite_odds = float(trade.market.current_odds_yes)
 
         # Check if betting on the underdog
         if odds <= self.CONTRARIAN_THRESHOLD:
-            confidence = Decimal("0.6") + (
-                (self.CONTRARIAN_THRESHOLD - odds) * 2
-            )
+            confidence = 0.6 + (self.CONTRARIAN_THRESHOLD - odds) * 2
 
             return Signal(
                 type=SignalType.CONTRARIAN,
-                confidence=min(confidence, Decimal("0.95")),
+                confidence=to_confidence(min(confidence, 0.95)),
                 description=(
                     f"Betting on {trade.side.value} at {odds:.1%} odds "
                     f"(consensus is {opposite_odds:.1%})"
                 ),
                 metadata={
                     "side": trade.side.value,
-                    "odds": float(odds),
-                    "opposite_odds": float(opposite_odds),
+                    "odds": odds,
+                    "opposite_odds": opposite_odds,
                     "market_question": trade.market.question,
                 },
             )
@@ -2,9 +2,9 @@
 
 from decimal import Decimal
 
-from scanner.config import ScannerConfig, config as default_config
+from scanner.config import ScannerConfig, get_config
 from scanner.domain.models import Signal, SignalType, Trade, WalletProfile
-from scanner.signals.base import SignalDetector
+from scanner.signals.base import SignalDetector, to_confidence
 
 
 class FreshWalletDetector(SignalDetector):
@@ -22,7 +22,7 @@ class FreshWalletDetector(SignalDetector):
         Args:
             config: Scanner configuration.
         """
-        self._config = config or default_config
+        self._config = config or get_config()
         self._trade_threshold = self._config.fresh_wallet_trade_threshold
 
     @property
@@ -57,12 +57,11 @@ class FreshWalletDetector(SignalDetector):
         if wallet_profile.is_fresh:
             # Calculate confidence based on how new the wallet is
             trade_count = wallet_profile.total_trades
-            confidence = Decimal("0.9") - (Decimal(str(trade_count)) * Decimal("0.1"))
-            confidence = max(confidence, Decimal("0.5"))
+            confidence = max(0.9 - trade_count * 0.1, 0.5)
 
             return Signal(
                 type=SignalType.FRESH_WALLET,
-                confidence=confidence,
+                confidence=to_confidence(confidence),
                 description=f"Wallet has only {trade_count} previous trades",
                 metadata={
                     "wallet": trade.wallet_address,
@@ -1,21 +1,63 @@
 """Odds movement correlation detector."""
 
+from array import array
+from bisect import bisect_left
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal
+from typing import TYPE_CHECKING
 
 from scanner.domain.models import Signal, SignalType, Trade, TradeSide, WalletProfile
-from scanner.signals.base import SignalDetector
+from scanner.signals.base import SignalDetector, to_confidence
 
+if TYPE_CHECKING:
+    from scanner.services.clock import TickClock
 
-@dataclass
-class OddsSnapshot:
-    """Snapshot of market odds at a point in time."""
+# Minimum absolute change in YES odds treated as significant
+SIGNIFICANT_MOVEMENT = 0.05
 
-    timestamp: datetime
-    odds_yes: Decimal
-    odds_no: Decimal
+
+@dataclass(slots=True)
+class OddsHistory:
+    """
+    Odds snapshots of one market, oldest first.
+
+    Snapshots are stored column-wise in typed arrays (epoch seconds, YES
+    odds, NO odds) rather than as one object per snapshot; expiry and
+    lookback are binary searches over the timestamp column.
+    """
+
+    timestamps: array = field(default_factory=lambda: array("d"))
+    odds_yes: array = field(default_factory=lambda: array("d"))
+    odds_no: array = field(default_factory=lambda: array("d"))
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def append(self, timestamp: datetime, odds_yes: float, odds_no: float) -> None:
+        """Add the newest snapshot."""
+        self.timestamps.append(timestamp.timestamp())
+        self.odds_yes.append(odds_yes)
+        self.odds_no.append(odds_no)
+
+    def expire(self, cutoff: datetime) -> None:
+        """Drop snapshots older than cutoff."""
+        timestamps = self.timestamps
+        cutoff_ts = cutoff.timestamp()
+        if not timestamps or timestamps[0] >= cutoff_ts:
+            return
+        expired = bisect_left(timestamps, cutoff_ts)
+        del timestamps[:expired]
+        del self.odds_yes[:expired]
+        del self.odds_no[:expired]
+
+    def odds_yes_since(self, cutoff: datetime) -> float | None:
+        """YES odds of the oldest snapshot taken at or after cutoff."""
+        index = bisect_left(self.timestamps, cutoff.timestamp())
+        if index == len(self.timestamps):
+            return None
+        return self.odds_yes[index]
 
 
 class OddsMovementDetector(SignalDetector):
@@ -27,15 +69,17 @@ class OddsMovementDetector(SignalDetector):
     - Trades during unusual volatility
     """
 
-    def __init__(self, lookback_minutes: int = 5):
+    def __init__(self, lookback_minutes: int = 5, clock: "TickClock | None" = None):
         """
         Initialize detector.
 
         Args:
             lookback_minutes: Minutes of odds history to track.
+            clock: Clock for snapshot timestamps. Uses datetime.now if not provided.
         """
+        self._now = clock.now if clock else datetime.now
         self._lookback = timedelta(minutes=lookback_minutes)
-        self._odds_history: dict[str, list[OddsSnapshot]] = defaultdict(list)
+        self._odds_history: dict[str, OddsHistory] = defaultdict(OddsHistory)
 
     @property
     def name(self) -> str:
@@ -48,19 +92,12 @@ class OddsMovementDetector(SignalDetector):
 
         Should be called periodically to track odds changes.
         """
-        self._odds_history[market_id].append(
-            OddsSnapshot(
-                timestamp=datetime.now(),
-                odds_yes=odds_yes,
-                odds_no=odds_no,
-            )
-        )
+        now = self._now()
+        history = self._odds_history[market_id]
+        history.append(now, float(odds_yes), float(odds_no))
 
         # Cleanup old snapshots
-        cutoff = datetime.now() - self._lookback * 2
-        self._odds_history[market_id] = [
-            s for s in self._odds_history[market_id] if s.timestamp >= cutoff
-        ]
+        history.expire(now - self._lookback * 2)
 
     async def detect(
         self,
@@ -81,44 +118,43 @@ class OddsMovementDetector(SignalDetector):
             return None
 
         market_id = trade.market_id
-        history = self._odds_history.get(market_id, [])
+        history = self._odds_history.get(market_id)
 
-        if len(history) < 2:
+        if history is None or len(history) < 2:
             # Not enough history
             return None
 
         # Get odds from lookback period
-        cutoff = trade.timestamp - self._lookback
-        recent = [s for s in history if s.timestamp >= cutoff]
+        first_odds = history.odds_yes_since(trade.timestamp - self._lookback)
 
-        if not recent:
+        if first_odds is None:
             return None
 
         # Calculate odds movement
-        first_odds = recent[0].odds_yes
-        current_odds = trade.market.current_odds_yes
-        movement = abs(current_odds - first_odds)
+        current_odds = float(trade.market.current_odds_yes)
+        # Rounded so float noise cannot push an exact 0.05 move below the threshold
+        movement = round(abs(current_odds - first_odds), 6)
 
         # Significant movement threshold (e.g., 5% change)
-        if movement >= Decimal("0.05"):
+        if movement >= SIGNIFICANT_MOVEMENT:
             # Check if trade direction aligns with movement
             odds_going_up = current_odds > first_odds
-            trade_is_yes = trade.side == TradeSide.YES
+            trade_is_yes = trade.side is TradeSide.YES
 
             aligned = odds_going_up == trade_is_yes
 
             return Signal(
                 type=SignalType.ODDS_MOVEMENT,
-                confidence=Decimal("0.7") + (movement * 2),
+                confidence=to_confidence(0.7 + movement * 2),
                 description=(
                     f"Odds moved {movement:.1%} in {self._lookback.seconds // 60}min, "
                     f"trade {'aligned' if aligned else 'contrary'}"
                 ),
                 metadata={
-                    "odds_change": float(movement),
+                    "odds_change": movement,
                     "aligned": aligned,
-                    "initial_odds": float(first_odds),
-                    "current_odds": float(current_odds),
+                    "initial_odds": first_odds,
+                    "current_odds": current_odds,
                 },
             )
 
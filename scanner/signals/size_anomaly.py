@@ -2,9 +2,19 @@
 
 from decimal import Decimal
 
-from scanner.config import ScannerConfig, config as default_config
+from scanner.config import ScannerConfig, get_config
 from scanner.domain.models import Signal, SignalType, Trade, WalletProfile
-from scanner.signals.base import SignalDetector
+from scanner.signals.base import SignalDetector, to_confidence
+
+# Share of market liquidity above which a trade is significant
+LIQUIDITY_RATIO_THRESHOLD = 0.05
+
+# Trades at or above this size (USD) are always notable
+LARGE_TRADE_USD = 50_000.0
+
+# Fixed confidences for the liquidity and large-trade checks
+LIQUIDITY_CONFIDENCE = Decimal("0.8")
+LARGE_TRADE_CONFIDENCE = Decimal("0.75")
 
 
 class SizeAnomalyDetector(SignalDetector):
@@ -21,8 +31,8 @@ class SizeAnomalyDetector(SignalDetector):
         Args:
             config: Scanner configuration.
         """
-        self._config = config or default_config
-        self._multiplier = self._config.size_anomaly_multiplier
+        self._config = config or get_config()
+        self._multiplier = float(self._config.size_anomaly_multiplier)
 
     @property
     def name(self) -> str:
@@ -44,22 +54,24 @@ class SizeAnomalyDetector(SignalDetector):
         Returns:
             SizeAnomaly signal if trade is unusually large.
         """
+        size_usd = trade.size_usd_f
         signals_data: dict = {
-            "trade_size": float(trade.size_usd),
+            "trade_size": size_usd,
             "wallet": trade.wallet_address,
         }
 
         # Check against wallet history
-        if wallet_profile and wallet_profile.avg_trade_size > 0:
-            ratio = trade.size_usd / wallet_profile.avg_trade_size
+        avg_trade_size = float(wallet_profile.avg_trade_size) if wallet_profile else 0.0
+        if avg_trade_size > 0:
+            ratio = size_usd / avg_trade_size
 
             if ratio >= self._multiplier:
-                signals_data["avg_trade_size"] = float(wallet_profile.avg_trade_size)
-                signals_data["size_ratio"] = float(ratio)
+                signals_data["avg_trade_size"] = avg_trade_size
+                signals_data["size_ratio"] = ratio
 
                 return Signal(
                     type=SignalType.SIZE_ANOMALY,
-                    confidence=min(Decimal("0.95"), Decimal("0.5") + ratio / 10),
+                    confidence=to_confidence(min(0.95, 0.5 + ratio / 10)),
                     description=(
                         f"Trade is {ratio:.1f}x larger than wallet average "
                         f"(${wallet_profile.avg_trade_size:.2f})"
@@ -68,17 +80,18 @@ class SizeAnomalyDetector(SignalDetector):
                 )
 
         # Check against market liquidity if available
-        if trade.market and trade.market.liquidity > 0:
-            liquidity_ratio = trade.size_usd / trade.market.liquidity
+        liquidity = float(trade.market.liquidity) if trade.market else 0.0
+        if liquidity > 0:
+            liquidity_ratio = size_usd / liquidity
 
             # If trade is >5% of market liquidity, that's significant
-            if liquidity_ratio >= Decimal("0.05"):
-                signals_data["market_liquidity"] = float(trade.market.liquidity)
-                signals_data["liquidity_ratio"] = float(liquidity_ratio)
+            if liquidity_ratio >= LIQUIDITY_RATIO_THRESHOLD:
+                signals_data["market_liquidity"] = liquidity
+                signals_data["liquidity_ratio"] = liquidity_ratio
 
                 return Signal(
                     type=SignalType.SIZE_ANOMALY,
-                    confidence=Decimal("0.8"),
+                    confidence=LIQUIDITY_CONFIDENCE,
                     description=(
                         f"Trade is {liquidity_ratio:.1%} of market liquidity"
                     ),
@@ -86,10 +99,10 @@ class SizeAnomalyDetector(SignalDetector):
                 )
 
         # Very large trades (>$50k) are always notable
-        if trade.size_usd >= Decimal("50000"):
+        if size_usd >= LARGE_TRADE_USD:
             return Signal(
                 type=SignalType.SIZE_ANOMALY,
-                confidence=Decimal("0.75"),
+                confidence=LARGE_TRADE_CONFIDENCE,
                 description=f"Large trade: ${trade.size_usd:,.2f}",
                 metadata=signals_data,
             )
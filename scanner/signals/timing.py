@@ -1,10 +1,9 @@
 """Timing-based signal detector."""
 
-from datetime import datetime, timedelta
-from decimal import Decimal
+from datetime import datetime, timedelta, timezone
 
 from scanner.domain.models import Signal, SignalType, Trade, WalletProfile
-from scanner.signals.base import SignalDetector
+from scanner.signals.base import SignalDetector, to_confidence
 
 
 class TimingDetector(SignalDetector):
@@ -15,8 +14,11 @@ class TimingDetector(SignalDetector):
     - Trades immediately after major events
     """
 
-    # UTC hours considered "off-peak" for US markets
-    OFF_PEAK_HOURS = set(range(0, 6)) | set(range(11, 14))  # 0-6 and 11-14 UTC
+    # UTC hours considered "off-peak" for US markets, one bit per hour
+    OFF_PEAK_MASK = sum(1 << h for h in (*range(0, 6), *range(11, 14)))  # 0-6 and 11-14 UTC
+
+    # Weekdays considered weekend, one bit per day (Saturday = 5, Sunday = 6)
+    WEEKEND_MASK = (1 << 5) | (1 << 6)
 
     def __init__(self):
         """Initialize detector."""
@@ -42,14 +44,15 @@ class TimingDetector(SignalDetector):
         Returns:
             TimingSignal if timing is notable.
         """
-        now = trade.timestamp
+        # Hours and weekdays below are UTC; naive timestamps are local time
+        now = trade.timestamp.astimezone(timezone.utc)
         signals_found: list[str] = []
-        confidence = Decimal("0.5")
+        confidence = 0.5
 
         # Check for off-peak trading
-        if now.hour in self.OFF_PEAK_HOURS:
+        if (self.OFF_PEAK_MASK >> now.hour) & 1:
             signals_found.append("off-peak hours")
-            confidence += Decimal("0.1")
+            confidence += 0.1
 
         # Check if market is close to resolution
         if trade.market and trade.market.end_date:
@@ -57,20 +60,20 @@ class TimingDetector(SignalDetector):
 
             if timedelta(0) < time_to_end <= timedelta(hours=24):
                 signals_found.append("within 24h of resolution")
-                confidence += Decimal("0.2")
+                confidence += 0.2
             elif timedelta(0) < time_to_end <= timedelta(hours=1):
                 signals_found.append("within 1h of resolution")
-                confidence += Decimal("0.3")
+                confidence += 0.3
 
         # Weekend trading (markets typically quieter)
-        if now.weekday() >= 5:  # Saturday = 5, Sunday = 6
+        if (self.WEEKEND_MASK >> now.weekday()) & 1:
             signals_found.append("weekend trading")
-            confidence += Decimal("0.1")
+            confidence += 0.1
 
         if signals_found:
             return Signal(
                 type=SignalType.TIMING_SIGNAL,
-                confidence=min(confidence, Decimal("0.95")),
+                confidence=to_confidence(min(confidence, 0.95)),
                 description=f"Timing factors: {', '.join(signals_found)}",
                 metadata={
                     "hour_utc": now.hour,
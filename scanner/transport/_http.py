@@ -0,0 +1,45 @@
+"""Shared aiohttp session factory for the REST transports and services."""
+
+from collections.abc import Mapping
+
+import aiohttp
+
+from scanner import _json
+
+
+# Pooled connections kept alive between polls, with cached DNS
+HTTP_CONNECTION_LIMIT = 32
+HTTP_CONNECTION_LIMIT_PER_HOST = 8
+HTTP_KEEPALIVE_TIMEOUT = 75.0
+HTTP_DNS_CACHE_TTL = 300
+
+# Request timeouts in seconds
+HTTP_TIMEOUT = 15.0
+HTTP_CONNECT_TIMEOUT = 5.0
+
+
+def create_session(headers: Mapping[str, str] | None = None) -> aiohttp.ClientSession:
+    """
+    Create an aiohttp session with a tuned connector.
+
+    Caps sockets per host, keeps idle connections alive across polls and
+    caches DNS, so repeated polls skip reconnecting.
+
+    Args:
+        headers: Default headers sent with every request.
+
+    Returns:
+        New client session. The caller owns it and must close it.
+    """
+    return aiohttp.ClientSession(
+        headers=headers,
+        json_serialize=_json.dumps,
+        connector=aiohttp.TCPConnector(
+            limit=HTTP_CONNECTION_LIMIT,
+            limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+            enable_cleanup_closed=True,
+        ),
+        timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+    )
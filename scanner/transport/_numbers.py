@@ -0,0 +1,34 @@
+"""Decimal conversion helpers shared by the transports."""
+
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any
+
+
+# Distinct numeric strings whose Decimal conversions are memoized
+DECIMAL_CACHE_SIZE = 4096
+
+# Decimal constants for trade value math
+DECIMAL_ONE = Decimal("1")
+DEFAULT_PRICE = Decimal("0.5")
+
+
+@lru_cache(maxsize=DECIMAL_CACHE_SIZE)
+def decimal_from_str(value: str) -> Decimal:
+    """
+    Convert a string to Decimal, memoized for repeated prices and sizes.
+
+    Raises:
+        decimal.InvalidOperation: If the string is not a number.
+    """
+    return Decimal(value)
+
+
+def safe_decimal(value: Any, default: Decimal = Decimal("0")) -> Decimal:
+    """Safely convert value to Decimal."""
+    if value is None or value == "":
+        return default
+    try:
+        return decimal_from_str(value if type(value) is str else str(value))
+    except Exception:
+        return default
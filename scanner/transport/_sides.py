@@ -0,0 +1,33 @@
+"""Trade side parsing shared by the transports."""
+
+from typing import Any
+
+
+# Side values as they appear verbatim in API payloads -> is it a YES trade;
+# anything else falls back to an upper-cased comparison against YES_SIDES
+_SIDE_IS_YES: dict[str | int, bool] = {
+    **{value: True for value in ("BUY", "Buy", "buy", "YES", "Yes", "yes", "0", 0)},
+    **{value: False for value in ("SELL", "Sell", "sell", "NO", "No", "no", "1", 1, "")},
+}
+
+# Upper-cased side values that denote a YES trade (buying the YES token)
+YES_SIDES = frozenset({"BUY", "YES", "0"})
+
+
+def is_yes_side(value: Any) -> bool:
+    """
+    Tell whether a raw side or outcome value denotes a YES trade.
+
+    Common spellings are a single dict lookup; others are upper-cased and
+    compared against YES_SIDES.
+
+    Args:
+        value: Side or outcome field from a trade payload.
+
+    Returns:
+        True for BUY/YES, False otherwise.
+    """
+    is_yes = _SIDE_IS_YES.get(value)
+    if is_yes is None:
+        is_yes = str(value).upper() in YES_SIDES
+    return is_yes
@@ -2,26 +2,148 @@
 
 import asyncio
 import logging
+import sys
+from collections import OrderedDict
 from collections.abc import AsyncIterator
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any
 
-from scanner.config import ScannerConfig, config as default_config
+from scanner import _json
+from scanner._keywords import build_keyword_classifier
+from scanner.config import ScannerConfig, get_config
 from scanner.domain.models import Market, MarketCategory, Trade, TradeSide
+from scanner.transport._numbers import DECIMAL_ONE, DEFAULT_PRICE, safe_decimal
+from scanner.transport._sides import is_yes_side
 
 
 logger = logging.getLogger(__name__)
 
+# Markets needing a parse beyond which _fetch_markets parses in a worker thread
+MARKET_PARSE_THREAD_THRESHOLD = 50
+
+# Distinct outcomePrices strings whose decoded odds are memoized
+OUTCOME_PRICES_CACHE_SIZE = 4096
+
+# Trade IDs remembered for de-duplication; the oldest are evicted first
+SEEN_TRADES_MAX_SIZE = 2000
+
+# Category keywords in priority order: the first category with any match wins
+MARKET_CATEGORY_WORDS: dict[MarketCategory, frozenset[str]] = {
+    MarketCategory.POLITICS: frozenset({
+        "election", "trump", "biden", "president", "congress", "vote", "senate", "governor",
+    }),
+    MarketCategory.CRYPTO: frozenset({
+        "bitcoin", "ethereum", "crypto", "btc", "eth", "solana", "coin",
+    }),
+    MarketCategory.SPORTS: frozenset({
+        "nfl", "nba", "mlb", "nhl", "soccer", "game", "match", "sports",
+        "win", "score", "championship", "playoff",
+    }),
+    MarketCategory.ECONOMICS: frozenset({
+        "fed", "inflation", "gdp", "economy", "rate", "jobs", "unemployment", "cpi",
+    }),
+}
+
+# Distinct (question, group title) pairs whose category is memoized
+CATEGORY_CACHE_SIZE = 4096
+
+# Classifies a market by keywords in its question and group title.
+# Memoized, since price-only changes re-parse a market with the same text.
+_classify_market_text = build_keyword_classifier(
+    MARKET_CATEGORY_WORDS, MarketCategory.OTHER, CATEGORY_CACHE_SIZE
+)
+
+
+def _parse_timestamp_slow(ts_value: Any) -> datetime:
+    """
+    Parse a trade timestamp that is not plain unix seconds.
 
-def safe_decimal(value: Any, default: Decimal = Decimal("0")) -> Decimal:
-    """Safely convert value to Decimal."""
-    if value is None or value == "":
-        return default
+    Handles millisecond values, numeric strings and ISO 8601 strings
+    (naive ones are taken as UTC). Falls back to the current time if the
+    value cannot be parsed. Always returns a UTC-aware datetime.
+    """
     try:
-        return Decimal(str(value))
+        if isinstance(ts_value, (int, float)):
+            # Too large for seconds, so it looks like ms
+            if ts_value > 1000000000000:
+                return datetime.fromtimestamp(ts_value / 1000, tz=timezone.utc)
+            return datetime.fromtimestamp(ts_value, tz=timezone.utc)
+        if isinstance(ts_value, str):
+            if ts_value.replace(".", "").isdigit():
+                ts_float = float(ts_value)
+                if ts_float > 1000000000000:
+                    return datetime.fromtimestamp(ts_float / 1000, tz=timezone.utc)
+                return datetime.fromtimestamp(ts_float, tz=timezone.utc)
+            parsed = datetime.fromisoformat(ts_value)
+            if parsed.tzinfo is None:
+                return parsed.replace(tzinfo=timezone.utc)
+            return parsed.astimezone(timezone.utc)
+    except (ValueError, OSError, OverflowError) as e:
+        logger.debug("Failed to parse timestamp %s: %s", ts_value, e)
+    return datetime.now(timezone.utc)
+
+
+@lru_cache(maxsize=OUTCOME_PRICES_CACHE_SIZE)
+def _parse_outcome_prices(outcome_prices: str) -> tuple[Decimal, Decimal] | None:
+    """
+    Decode a Gamma outcomePrices JSON string into (yes, no) odds.
+
+    Memoized: many markets share the same price strings, and unchanged
+    markets repeat theirs on every refresh.
+    """
+    try:
+        prices = _json.loads(outcome_prices)
     except Exception:
-        return default
+        return None
+    if prices and len(prices) >= 2:
+        return (
+            safe_decimal(prices[0], Decimal("0.5")),
+            safe_decimal(prices[1], Decimal("0.5")),
+        )
+    return None
+
+
+def _fallback_trade_id(data: dict) -> str:
+    """Build a trade ID for Data API trades without a transactionHash."""
+    ts = data.get("timestamp", 0)
+    wallet = data.get("proxyWallet", data.get("maker", ""))
+    asset = data.get("asset", data.get("token_id", ""))
+    size = data.get("size", 0)
+    return f"{wallet}_{asset}_{ts}_{size}"
+
+
+# Gamma market fields that feed _parse_market; a change to any re-parses it.
+# tokens carries per-outcome prices used when outcomePrices is missing.
+MARKET_FINGERPRINT_FIELDS = (
+    "conditionId",
+    "condition_id",
+    "question",
+    "groupItemTitle",
+    "outcomePrices",
+    "tokens",
+    "clobTokenIds",
+    "volume24hr",
+    "volume",
+    "liquidity",
+    "active",
+    "closed",
+)
+
+
+def _hashable(value: Any) -> Any:
+    """Convert JSON lists and objects into hashable tuples."""
+    if isinstance(value, list):
+        return tuple(map(_hashable, value))
+    if isinstance(value, dict):
+        return tuple((key, _hashable(item)) for key, item in value.items())
+    return value
+
+
+def market_fingerprint(data: dict) -> int:
+    """Hash the Gamma market fields that affect the parsed Market."""
+    return hash(tuple(map(_hashable, map(data.get, MARKET_FINGERPRINT_FIELDS))))
 
 
 class PolymarketCLOBClient:
@@ -46,13 +168,16 @@ class PolymarketCLOBClient:
             poll_interval: Seconds between trade polls.
             market_refresh_interval: Seconds between market cache refreshes.
         """
-        self._config = config or default_config
+        self._config = config or get_config()
         self._poll_interval = poll_interval
         self._market_refresh_interval = market_refresh_interval
         self._running = False
-        self._seen_trades: set[str] = set()
+        self._seen_trades: OrderedDict[str, None] = OrderedDict()
         self._markets_cache: dict[str, Market] = {}
+        # conditionId -> (payload fingerprint, parsed market)
+        self._market_parse_cache: dict[str, tuple[int, Market]] = {}
         self._condition_ids: set[str] = set()  # Active market condition IDs
+        self._token_ids: set[str] = set()  # Active market CLOB token IDs
         self._client = None
         self._last_market_refresh: float = 0
         self._session: Any = None  # Reusable aiohttp session
@@ -88,7 +213,7 @@ class PolymarketCLOBClient:
             # Derive API credentials
             self._client.set_api_creds(self._client.derive_api_key())
 
-            logger.info(f"CLOB client initialized (chain_id={chain_id})")
+            logger.info("CLOB client initialized (chain_id=%s)", chain_id)
 
         except ImportError:
             raise ImportError(
@@ -99,11 +224,14 @@ class PolymarketCLOBClient:
 
     async def _get_session(self):
         """Get or create reusable aiohttp session."""
-        import aiohttp
-        
+        from aiohttp.compression_utils import HAS_BROTLI
+
+        from scanner.transport._http import create_session
+
         if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=30, connect=10)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+            # Only advertise br when aiohttp can decode it (Brotli installed)
+            encodings = "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate"
+            self._session = create_session(headers={"Accept-Encoding": encodings})
         return self._session
 
     async def _fetch_markets(self, retries: int = 3) -> list[dict]:
@@ -117,30 +245,28 @@ class PolymarketCLOBClient:
                 session = await self._get_session()
                 async with session.get(url) as resp:
                     if resp.status != 200:
-                        logger.error(f"Gamma API error: {resp.status}")
+                        logger.error("Gamma API error: %s", resp.status)
                         if attempt < retries - 1:
                             await asyncio.sleep(2 ** attempt)
                             continue
                         return []
-                    events = await resp.json()
+                    events = _json.loads(await resp.read())
                 
                 if not isinstance(events, list):
-                    logger.warning(f"Unexpected Gamma API response type: {type(events)}")
+                    logger.warning("Unexpected Gamma API response type: %s", type(events))
                     return []
                 
-                logger.info(f"Gamma API returned {len(events)} active events")
+                logger.info("Gamma API returned %d active events", len(events))
                 break
                 
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                logger.warning(f"Gamma API request failed (attempt {attempt + 1}/{retries}): {e}")
+            except (aiohttp.ClientError, asyncio.TimeoutError, _json.JSONDecodeError) as e:
+                logger.warning("Gamma API request failed (attempt %d/%d): %s", attempt + 1, retries, e)
                 if attempt < retries - 1:
+                    # The session is shared with concurrent trade fetches, so
+                    # it is kept; the pool drops broken connections itself
                     await asyncio.sleep(2 ** attempt)
-                    # Reset session on connection errors
-                    if self._session and not self._session.closed:
-                        await self._session.close()
-                    self._session = None
                     continue
-                logger.error(f"Failed to fetch markets after {retries} attempts")
+                logger.error("Failed to fetch markets after %d attempts", retries)
                 return []
         else:
             return []
@@ -148,6 +274,8 @@ class PolymarketCLOBClient:
         # Each event can have multiple markets
         all_markets = []
         try:
+            # (market, condition_id, token IDs, fingerprint, cached parse or None)
+            entries: list[tuple[dict, str, list, int, Market | None]] = []
             for event in events:
                 if not isinstance(event, dict):
                     continue
@@ -165,38 +293,64 @@ class PolymarketCLOBClient:
                     if not market.get("active", True) or market.get("closed", False):
                         continue
                     
-                    # Get token IDs from clobTokenIds field
+                    # Get token IDs from clobTokenIds field (a JSON string in Gamma)
                     clob_ids = market.get("clobTokenIds", [])
+                    if isinstance(clob_ids, str):
+                        try:
+                            clob_ids = _json.loads(clob_ids)
+                        except _json.JSONDecodeError:
+                            clob_ids = []
                     condition_id = market.get("conditionId", "")
                     
                     # Also store condition_id for live-activity API
                     if condition_id and condition_id not in self._condition_ids:
                         self._condition_ids.add(condition_id)
                     
-                    # Parse and cache market by each token_id
-                    parsed_market = self._parse_market(market)
-                    
-                    for token_id in clob_ids:
-                        if token_id:
-                            self._markets_cache[token_id] = parsed_market
-                    
-                    # Also cache by condition_id
-                    if condition_id:
-                        self._markets_cache[condition_id] = parsed_market
-                    
+                    # Reuse the previous parse while the payload is unchanged
+                    fingerprint = market_fingerprint(market)
+                    cached = self._market_parse_cache.get(condition_id)
+                    parsed_market = cached[1] if cached is not None and cached[0] == fingerprint else None
+                    entries.append((market, condition_id, clob_ids, fingerprint, parsed_market))
                     all_markets.append(market)
+
+            # Parse new and changed markets; large batches (startup) run in
+            # a worker thread so the event loop keeps serving other tasks
+            stale = [entry[0] for entry in entries if entry[4] is None]
+            if len(stale) > MARKET_PARSE_THREAD_THRESHOLD:
+                fresh = iter(await asyncio.to_thread(lambda: [self._parse_market(m) for m in stale]))
+            else:
+                fresh = map(self._parse_market, stale)
+
+            # Cache each market by its token IDs and condition_id
+            for market, condition_id, clob_ids, fingerprint, parsed_market in entries:
+                if parsed_market is None:
+                    parsed_market = next(fresh)
+                    if condition_id:
+                        self._market_parse_cache[condition_id] = (fingerprint, parsed_market)
+                
+                for token_id in clob_ids:
+                    if token_id:
+                        self._markets_cache[token_id] = parsed_market
+                        self._token_ids.add(token_id)
+                
+                if condition_id:
+                    self._markets_cache[condition_id] = parsed_market
             
-            logger.info(f"Cached {len(self._markets_cache)} tokens from {len(all_markets)} active markets")
+            logger.info(
+                "Cached %d tokens from %d active markets",
+                len(self._markets_cache),
+                len(all_markets),
+            )
             
             # Log first market for debugging
-            if all_markets:
+            if all_markets and logger.isEnabledFor(logging.DEBUG):
                 m = all_markets[0]
-                logger.debug(f"Sample market: {m.get('question', 'Unknown')[:60]}...")
+                logger.debug("Sample market: %s...", m.get("question", "Unknown")[:60])
             
             return all_markets
 
         except Exception as e:
-            logger.error(f"Failed to fetch markets: {e}", exc_info=True)
+            logger.error("Failed to fetch markets: %s", e, exc_info=True)
             return []
 
     def _parse_market(self, data: dict) -> Market:
@@ -213,21 +367,10 @@ class PolymarketCLOBClient:
         - active, closed: status flags
         - groupItemTitle: category/group
         """
-        question = data.get("question", "").lower()
-        group_title = data.get("groupItemTitle", "").lower()
-        category = MarketCategory.OTHER
-
         # Determine category from question or group
-        text_to_check = f"{question} {group_title}"
-        
-        if any(w in text_to_check for w in ["election", "trump", "biden", "president", "congress", "vote", "senate", "governor"]):
-            category = MarketCategory.POLITICS
-        elif any(w in text_to_check for w in ["bitcoin", "ethereum", "crypto", "btc", "eth", "solana", "coin"]):
-            category = MarketCategory.CRYPTO
-        elif any(w in text_to_check for w in ["nfl", "nba", "mlb", "nhl", "soccer", "game", "match", "sports", "win", "score", "championship", "playoff"]):
-            category = MarketCategory.SPORTS
-        elif any(w in text_to_check for w in ["fed", "inflation", "gdp", "economy", "rate", "jobs", "unemployment", "cpi"]):
-            category = MarketCategory.ECONOMICS
+        category = _classify_market_text(
+            data.get("question", ""), data.get("groupItemTitle", "")
+        )
 
         # Parse odds from outcomePrices (Gamma API format)
         odds_yes = Decimal("0.5")
@@ -238,15 +381,17 @@ class PolymarketCLOBClient:
         
         # Handle if it's a string (JSON)
         if isinstance(outcome_prices, str):
-            try:
-                import json
-                outcome_prices = json.loads(outcome_prices)
-            except Exception:
-                outcome_prices = []
-        
-        if outcome_prices and len(outcome_prices) >= 2:
-            odds_yes = safe_decimal(outcome_prices[0], Decimal("0.5"))
-            odds_no = safe_decimal(outcome_prices[1], Decimal("0.5"))
+            parsed_odds = _parse_outcome_prices(outcome_prices)
+        elif outcome_prices and len(outcome_prices) >= 2:
+            parsed_odds = (
+                safe_decimal(outcome_prices[0], Decimal("0.5")),
+                safe_decimal(outcome_prices[1], Decimal("0.5")),
+            )
+        else:
+            parsed_odds = None
+
+        if parsed_odds is not None:
+            odds_yes, odds_no = parsed_odds
         else:
             # Fallback to CLOB API format with tokens
             tokens = data.get("tokens", [])
@@ -274,7 +419,7 @@ class PolymarketCLOBClient:
             metadata=data,
         )
 
-    async def _fetch_trades(self) -> list[dict]:
+    async def _fetch_trades(self) -> list:
         """Fetch recent trades using Data API /trades endpoint.
         
         Uses 'after' parameter to fetch only trades newer than last poll,
@@ -292,65 +437,70 @@ class PolymarketCLOBClient:
         - transactionHash: unique trade identifier
         """
         import aiohttp
-        import time
-        
+
+        # Use 'after' parameter to get only new trades since last poll
+        # This reduces response size and simplifies deduplication
+        url = "https://data-api.polymarket.com/trades?limit=200"
+        if self._last_trade_timestamp > 0:
+            url += f"&after={self._last_trade_timestamp}"
+            logger.debug("Fetching trades after timestamp %d", self._last_trade_timestamp)
+
         try:
             session = await self._get_session()
-            
-            # Use 'after' parameter to get only new trades since last poll
-            # This reduces response size and simplifies deduplication
-            url = "https://data-api.polymarket.com/trades?limit=200"
-            
-            if self._last_trade_timestamp > 0:
-                # Add 'after' parameter to fetch only newer trades
-                url += f"&after={self._last_trade_timestamp}"
-                logger.debug(f"Fetching trades after timestamp {self._last_trade_timestamp}")
-            
-            try:
-                async with session.get(url) as resp:
-                    if resp.status != 200:
-                        logger.error(f"Data API error: {resp.status}")
-                        return []
-                    
-                    trades = await resp.json()
-                    
-                    if not trades or not isinstance(trades, list):
-                        logger.debug("No trades from Data API")
-                        return []
-                    
-                    # Update last timestamp from newest trade
-                    max_timestamp = self._last_trade_timestamp
-                    for trade in trades:
-                        if isinstance(trade, dict):
-                            ts = trade.get("timestamp", 0)
-                            if isinstance(ts, (int, float)) and ts > max_timestamp:
-                                max_timestamp = int(ts)
-                    
-                    if max_timestamp > self._last_trade_timestamp:
-                        self._last_trade_timestamp = max_timestamp
-                        logger.debug(f"Updated last_trade_timestamp to {max_timestamp}")
-                    
-                    # Normalize field names
-                    all_trades = []
-                    for trade in trades:
-                        if isinstance(trade, dict):
-                            trade["condition_id"] = trade.get("conditionId", "")
-                            trade["token_id"] = trade.get("asset", "")
-                            trade["maker"] = trade.get("proxyWallet", "unknown")
-                            all_trades.append(trade)
-                    
-                    logger.debug(f"Fetched {len(all_trades)} trades from Data API (after={self._last_trade_timestamp})")
-                    
-                    return all_trades
-                                        
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                logger.warning(f"Error fetching trades: {e}")
-                return []
-
+            async with session.get(url) as resp:
+                if resp.status != 200:
+                    logger.error("Data API error: %s", resp.status)
+                    return []
+                trades = _json.loads(await resp.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning("Error fetching trades: %s", e)
+            return []
         except Exception as e:
-            logger.error(f"Failed to fetch trades: {e}")
+            logger.error("Failed to fetch trades: %s", e)
+            return []
+
+        if not trades or type(trades) is not list:
+            logger.debug("No trades from Data API")
             return []
 
+        logger.debug(
+            "Fetched %d trades from Data API (after=%d)",
+            len(trades),
+            self._last_trade_timestamp,
+        )
+        return trades
+
+    def _parse_trades(self, trades: list) -> list[Trade]:
+        """
+        Parse a Data API /trades response in a single pass.
+
+        Advances the 'after' timestamp from every trade in the response,
+        including ones already seen, while collecting the new trades.
+
+        Args:
+            trades: Decoded /trades response.
+
+        Returns:
+            Newly seen trades, in response order.
+        """
+        max_timestamp = self._last_trade_timestamp
+        parsed = []
+        for data in trades:
+            if type(data) is not dict:
+                continue
+            ts = data.get("timestamp", 0)
+            if type(ts) in (int, float) and ts > max_timestamp:
+                max_timestamp = int(ts)
+            trade = self._parse_trade(data)
+            if trade is not None:
+                parsed.append(trade)
+
+        if max_timestamp > self._last_trade_timestamp:
+            self._last_trade_timestamp = max_timestamp
+            logger.debug("Updated last_trade_timestamp to %d", max_timestamp)
+
+        return parsed
+
     def _parse_trade(self, data: dict) -> Trade | None:
         """Parse trade data from Data API /trades response.
         
@@ -366,77 +516,58 @@ class PolymarketCLOBClient:
         - slug: market URL slug
         - transactionHash: unique blockchain transaction hash
         """
+        get = data.get
         try:
-            # Use transactionHash as unique trade ID (most reliable)
-            trade_id = data.get("transactionHash", "")
-            
-            # Fallback if no transactionHash
-            if not trade_id:
-                ts = data.get("timestamp", 0)
-                wallet = data.get("proxyWallet", data.get("maker", ""))
-                asset = data.get("asset", data.get("token_id", ""))
-                size = data.get("size", 0)
-                trade_id = f"{wallet}_{asset}_{ts}_{size}"
-
+            # Use transactionHash as unique trade ID (most reliable), and
+            # drop repeats from overlapping polls before any parsing
+            trade_id = get("transactionHash") or _fallback_trade_id(data)
             if trade_id in self._seen_trades:
                 return None
 
-            self._seen_trades.add(trade_id)
-
-            # Keep cache manageable (smaller now since 'after' param handles most filtering)
-            if len(self._seen_trades) > 2000:
-                self._seen_trades = set(list(self._seen_trades)[-1000:])
-
             # Parse fields
-            size = safe_decimal(data.get("size", 0))
-            price = safe_decimal(data.get("price"), Decimal("0.5"))
+            size = safe_decimal(get("size", 0))
+            price = safe_decimal(get("price"), DEFAULT_PRICE)
 
-            # Determine side - Data API uses BUY/SELL
-            side_str = str(data.get("side", "")).upper()
-            if side_str == "BUY":
+            # Determine side - Data API uses BUY/SELL (exact match is the norm)
+            if is_yes_side(get("side", "")):
                 side = TradeSide.YES
                 # For BUY YES tokens: USD value = size * price
                 size_usd = size * price
             else:
                 side = TradeSide.NO
                 # For SELL (buy NO): USD value = size * (1 - price)
-                size_usd = size * (Decimal("1") - price)
+                size_usd = size * (DECIMAL_ONE - price)
 
-            # Parse timestamp (Data API returns seconds, not milliseconds)
-            timestamp = datetime.now()
-            ts_value = data.get("timestamp")
-            if ts_value:
+            if size_usd <= 0:
+                return None
+
+            # Parse timestamp as UTC. The Data API sends integer seconds, so
+            # try that directly and leave other shapes to the slow path.
+            # A missing or zero timestamp means "unknown", not the epoch.
+            ts_value = get("timestamp")
+            if not ts_value:
+                timestamp = datetime.now(timezone.utc)
+            else:
                 try:
-                    if isinstance(ts_value, (int, float)):
-                        # Data API uses seconds, check if it looks like ms
-                        if ts_value > 1000000000000:
-                            timestamp = datetime.fromtimestamp(ts_value / 1000)
-                        else:
-                            timestamp = datetime.fromtimestamp(ts_value)
-                    elif isinstance(ts_value, str):
-                        if ts_value.replace(".", "").isdigit():
-                            ts_float = float(ts_value)
-                            if ts_float > 1000000000000:
-                                timestamp = datetime.fromtimestamp(ts_float / 1000)
-                            else:
-                                timestamp = datetime.fromtimestamp(ts_float)
-                        else:
-                            timestamp = datetime.fromisoformat(
-                                ts_value.replace("Z", "+00:00")
-                            )
-                except (ValueError, OSError) as e:
-                    logger.debug(f"Failed to parse timestamp {ts_value}: {e}")
-
-            # Get wallet address from proxyWallet field
-            wallet = data.get("proxyWallet", data.get("maker", "unknown"))
+                    timestamp = datetime.fromtimestamp(ts_value, tz=timezone.utc)
+                except (TypeError, ValueError, OSError, OverflowError):
+                    timestamp = _parse_timestamp_slow(ts_value)
+
+            # Get wallet address from proxyWallet field. Interned so the
+            # per-wallet dict lookups downstream hit the identity fast path.
+            # Fallback keys are only looked up when the Data API key is missing.
+            wallet = sys.intern(get("proxyWallet") or get("maker") or "unknown")
             
             # Get market ID
-            condition_id = data.get("conditionId", data.get("condition_id", ""))
-            asset_id = data.get("asset", data.get("token_id", ""))
+            condition_id = get("conditionId") or get("condition_id") or ""
+            asset_id = get("asset") or get("token_id") or ""
             market_id = condition_id or asset_id
             
-            # Try to find market in cache
-            market = self._markets_cache.get(condition_id) or self._markets_cache.get(asset_id)
+            # Try to find market in cache. Markets are cached under both
+            # IDs, so the asset ID only matters if the condition ID misses.
+            market = self._markets_cache.get(market_id)
+            if market is None and asset_id and asset_id != market_id:
+                market = self._markets_cache.get(asset_id)
 
             trade = Trade(
                 id=trade_id,
@@ -450,22 +581,32 @@ class PolymarketCLOBClient:
                 raw_data=data,
             )
 
+            # Keep cache manageable (small since 'after' param handles most filtering)
+            self._seen_trades[trade_id] = None
+            if len(self._seen_trades) > SEEN_TRADES_MAX_SIZE:
+                self._seen_trades.popitem(last=False)
+
             # Log trade (show question if available)
-            question = data.get("title", market.question if market else "Unknown")[:40]
-            logger.info(
-                f"Trade: {wallet[:8]}... {side.value} ${size_usd:.2f} @ {price:.3f} | {question}..."
-            )
+            if logger.isEnabledFor(logging.INFO):
+                question = get("title", market.question if market else "Unknown")[:40]
+                logger.info(
+                    "Trade: %s... %s $%.2f @ %.3f | %s...",
+                    wallet[:8], side.value, size_usd, price, question,
+                )
 
             return trade
 
         except Exception as e:
-            logger.debug(f"Failed to parse trade: {e}", exc_info=True)
+            logger.debug("Failed to parse trade: %s", e, exc_info=True)
             return None
 
     async def trades(self) -> AsyncIterator[Trade]:
         """
         Poll for new trades.
 
+        Streams them over the market WebSocket instead when
+        clob_stream_trades is enabled in the config.
+
         Yields:
             Trade objects.
         """
@@ -480,39 +621,107 @@ class PolymarketCLOBClient:
         await self._fetch_markets()
         self._last_market_refresh = time.time()
 
-        logger.info(f"CLOB client polling (interval: {self._poll_interval}s, market refresh: {self._market_refresh_interval}s)")
+        if self._config.clob_stream_trades:
+            async for trade in self._stream_trades():
+                yield trade
+            return
+
+        logger.info(
+            "CLOB client polling (interval: %ss, market refresh: %ss)",
+            self._poll_interval,
+            self._market_refresh_interval,
+        )
 
         try:
             while self._running:
                 try:
-                    trades = await self._fetch_trades()
-                    new_trades_count = 0
-
-                    for trade_data in trades:
-                        trade = self._parse_trade(trade_data)
-                        if trade and trade.size_usd > 0:
-                            new_trades_count += 1
-                            yield trade
-
-                    if new_trades_count > 0:
-                        logger.info(f"Found {new_trades_count} new trades this poll")
-                    else:
-                        logger.debug(f"No new trades (seen {len(self._seen_trades)} unique)")
-
-                    # Refresh markets periodically by time
+                    # Refresh markets periodically by time, alongside the
+                    # trade poll so the Gamma call does not delay trades
                     current_time = time.time()
                     if current_time - self._last_market_refresh > self._market_refresh_interval:
                         logger.debug("Refreshing market cache...")
-                        await self._fetch_markets()
+                        trades, _ = await asyncio.gather(
+                            self._fetch_trades(), self._fetch_markets()
+                        )
                         self._last_market_refresh = current_time
+                    else:
+                        trades = await self._fetch_trades()
+
+                    new_trades = self._parse_trades(trades)
+                    for trade in new_trades:
+                        yield trade
+
+                    if new_trades:
+                        logger.info("Found %d new trades this poll", len(new_trades))
+                    else:
+                        logger.debug("No new trades (seen %d unique)", len(self._seen_trades))
 
                 except Exception as e:
-                    logger.error(f"Polling error: {e}")
+                    logger.error("Polling error: %s", e)
 
                 await asyncio.sleep(self._poll_interval)
         finally:
             await self._close_session()
 
+    async def _stream_trades(self) -> AsyncIterator[Trade]:
+        """
+        Stream trades from the market WebSocket instead of polling.
+
+        Subscribes to the token IDs of the cached markets and keeps
+        refreshing markets in the background, subscribing to new tokens
+        as they appear. Trades are attached to cached markets.
+
+        Yields:
+            Trade objects.
+        """
+        from scanner.transport.websocket import PolymarketWebSocket
+
+        ws = PolymarketWebSocket(self._config)
+        refresh_task = asyncio.create_task(self._refresh_markets_periodically(ws))
+
+        logger.info(
+            "CLOB client streaming trades (%d assets, market refresh: %ss)",
+            len(self._token_ids),
+            self._market_refresh_interval,
+        )
+
+        try:
+            async for trade in ws.trades(asset_ids=sorted(self._token_ids) or None):
+                if not self._running:
+                    break
+                asset_id = trade.raw_data.get("asset_id", "")
+                trade.market = self._markets_cache.get(trade.market_id) or self._markets_cache.get(asset_id)
+                yield trade
+        finally:
+            refresh_task.cancel()
+            try:
+                await refresh_task
+            except asyncio.CancelledError:
+                pass
+            await ws.disconnect()
+            await self._close_session()
+
+    async def _refresh_markets_periodically(self, ws: Any) -> None:
+        """
+        Refresh markets on a timer while streaming trades.
+
+        Args:
+            ws: Connected PolymarketWebSocket to subscribe new tokens on.
+        """
+        import time
+
+        while self._running:
+            await asyncio.sleep(self._market_refresh_interval)
+            try:
+                known = set(self._token_ids)
+                await self._fetch_markets()
+                self._last_market_refresh = time.time()
+                new_tokens = self._token_ids - known
+                if new_tokens and ws.is_connected:
+                    await ws.subscribe(sorted(new_tokens))
+            except Exception as e:
+                logger.error("Market refresh error: %s", e)
+
     async def _close_session(self) -> None:
         """Close aiohttp session."""
         if self._session and not self._session.closed:
@@ -1,8 +1,9 @@
 """Mock trade generator for testing."""
 
 import asyncio
+import math
+import os
 import random
-import uuid
 from collections.abc import AsyncIterator
 from datetime import datetime
 from decimal import Decimal
@@ -24,6 +25,13 @@ SAMPLE_QUESTIONS = [
     "Will autonomous vehicles be approved for widespread use?",
 ]
 
+# Random bytes fetched per refill of the ID buffer
+RANDOM_ID_BUFFER_SIZE = 4096
+
+# Shortest sleep between bursts of trades; at high rates several trades
+# are emitted per wakeup instead of sleeping for sub-tick intervals
+MIN_TICK_SECONDS = 0.05
+
 # Sample wallet addresses (mock)
 SAMPLE_WALLETS = [
     "0x742d35Cc6634C0532925a3b844Bc9e7595f8fE10",
@@ -36,6 +44,19 @@ SAMPLE_WALLETS = [
     "0xWhale0000000000000000000000000000000001",
 ]
 
+# Wallet pools for trade generation, sliced once: the last three are fresh/whale
+REGULAR_WALLETS = tuple(SAMPLE_WALLETS[:-3])
+FRESH_WALLETS = tuple(SAMPLE_WALLETS[-3:])
+
+# Categories assigned to generated markets
+MOCK_CATEGORIES = (
+    MarketCategory.POLITICS,
+    MarketCategory.ECONOMICS,
+    MarketCategory.SCIENCE,
+    MarketCategory.ENTERTAINMENT,
+    MarketCategory.OTHER,
+)
+
 
 class MockTradeGenerator:
     """
@@ -66,54 +87,69 @@ class MockTradeGenerator:
         self._large_prob = large_trade_probability
         self._running = False
         self._markets: dict[str, Market] = {}
+        self._rand_buf = b""
+        self._rand_off = 0
 
         # Pre-generate some markets
         self._generate_markets()
+        # (market, YES odds as float) pairs, and integer size bounds, so
+        # each generated trade skips the Decimal conversions
+        self._market_list = tuple(
+            (market, float(market.current_odds_yes)) for market in self._markets.values()
+        )
+        self._min_size_int = int(min_size)
+        self._max_size_int = int(max_size)
+
+    def _short_id(self, n: int = 6) -> str:
+        """
+        Return a random hex ID of n bytes.
+
+        Slices a buffer refilled from os.urandom in large chunks, instead
+        of building a UUID per ID.
+        """
+        off = self._rand_off
+        if off + n > len(self._rand_buf):
+            self._rand_buf = os.urandom(RANDOM_ID_BUFFER_SIZE)
+            off = 0
+        self._rand_off = off + n
+        return self._rand_buf[off:off + n].hex()
 
     def _generate_markets(self) -> None:
         """Generate mock markets."""
-        categories = [
-            MarketCategory.POLITICS,
-            MarketCategory.ECONOMICS,
-            MarketCategory.SCIENCE,
-            MarketCategory.ENTERTAINMENT,
-            MarketCategory.OTHER,
-        ]
-
         for i, question in enumerate(SAMPLE_QUESTIONS):
-            market_id = f"market_{uuid.uuid4().hex[:8]}"
-            odds_yes = Decimal(str(random.randint(20, 80))) / 100
+            market_id = f"market_{self._short_id(4)}"
+            odds_yes = Decimal(random.randint(20, 80)) / 100
 
             self._markets[market_id] = Market(
                 id=market_id,
                 question=question,
-                category=random.choice(categories),
+                category=random.choice(MOCK_CATEGORIES),
                 current_odds_yes=odds_yes,
                 current_odds_no=1 - odds_yes,
-                volume_24h=Decimal(str(random.randint(10000, 500000))),
-                liquidity=Decimal(str(random.randint(50000, 300000))),
+                volume_24h=Decimal(random.randint(10000, 500000)),
+                liquidity=Decimal(random.randint(50000, 300000)),
             )
 
     def _generate_trade(self) -> Trade:
         """Generate a single mock trade."""
-        market = random.choice(list(self._markets.values()))
+        market, odds_yes = random.choice(self._market_list)
 
         # Determine trade size
         if random.random() < self._large_prob:
             # Large trade
-            size = Decimal(str(random.randint(5000, int(self._max_size))))
+            size = Decimal(random.randrange(5000, self._max_size_int + 1))
         else:
             # Normal trade
-            size = Decimal(str(random.randint(int(self._min_size), 5000)))
+            size = Decimal(random.randrange(self._min_size_int, 5001))
 
         # Choose wallet - bias towards fresh wallets occasionally
         if random.random() < 0.2:
-            wallet = random.choice(SAMPLE_WALLETS[-3:])  # Fresh/whale wallets
+            wallet = random.choice(FRESH_WALLETS)
         else:
-            wallet = random.choice(SAMPLE_WALLETS[:-3])
+            wallet = random.choice(REGULAR_WALLETS)
 
         # Determine side - slight bias based on current odds
-        if random.random() < float(market.current_odds_yes):
+        if random.random() < odds_yes:
             side = TradeSide.YES
             price = market.current_odds_yes
         else:
@@ -121,7 +157,7 @@ class MockTradeGenerator:
             price = market.current_odds_no
 
         return Trade(
-            id=f"trade_{uuid.uuid4().hex[:12]}",
+            id=f"trade_{self._short_id(6)}",
             market_id=market.id,
             wallet_address=wallet,
             side=side,
@@ -140,14 +176,19 @@ class MockTradeGenerator:
         """
         self._running = True
         interval = 60.0 / self._rate  # Seconds between trades
+        # Trades per wakeup, keeping the average rate unchanged
+        batch = max(1, math.ceil(MIN_TICK_SECONDS / interval))
+        tick = interval * batch
 
         while self._running:
             # Add some randomness to timing
             jitter = random.uniform(0.5, 1.5)
-            await asyncio.sleep(interval * jitter)
+            await asyncio.sleep(tick * jitter)
 
-            trade = self._generate_trade()
-            yield trade
+            for i in range(batch):
+                if i:
+                    await asyncio.sleep(0)
+                yield self._generate_trade()
 
     def stop(self) -> None:
         """Stop generating trades."""
@@ -1,28 +1,59 @@
 """REST API polling transport for Polymarket trades."""
 
 import asyncio
+import hashlib
 import logging
+import sys
+import time
+from collections import deque
 from collections.abc import AsyncIterator
 from datetime import datetime
 from decimal import Decimal
 
 import aiohttp
 
-from scanner.config import ScannerConfig, config as default_config
+from scanner import _json
+from scanner._keywords import build_keyword_classifier
+from scanner.config import ScannerConfig, get_config
 from scanner.domain.models import Market, MarketCategory, Trade, TradeSide
+from scanner.transport._http import create_session
+from scanner.transport._numbers import DECIMAL_ONE, DEFAULT_PRICE, safe_decimal
+from scanner.transport._sides import is_yes_side
 
 
 logger = logging.getLogger(__name__)
 
+# Category keywords in priority order: the first category with any match wins
+MARKET_CATEGORY_WORDS: dict[MarketCategory, frozenset[str]] = {
+    MarketCategory.POLITICS: frozenset({"election", "trump", "biden", "president", "congress"}),
+    MarketCategory.CRYPTO: frozenset({"bitcoin", "ethereum", "crypto", "btc", "eth"}),
+    MarketCategory.SPORTS: frozenset({"nfl", "nba", "soccer", "football", "game", "match"}),
+    MarketCategory.ECONOMICS: frozenset({"fed", "inflation", "gdp", "economy", "rate"}),
+    MarketCategory.SCIENCE: frozenset({"ai", "spacex", "nasa", "science"}),
+}
 
-def safe_decimal(value, default: Decimal = Decimal("0")) -> Decimal:
-    """Safely convert value to Decimal."""
-    if value is None or value == "":
-        return default
-    try:
-        return Decimal(str(value))
-    except Exception:
-        return default
+# Distinct questions whose category is memoized
+CATEGORY_CACHE_SIZE = 4096
+
+# Classifies a market by keywords in its question
+_classify_question = build_keyword_classifier(
+    MARKET_CATEGORY_WORDS, MarketCategory.OTHER, CATEGORY_CACHE_SIZE
+)
+
+
+# Trade IDs remembered for de-duplication; the oldest are evicted first
+SEEN_TRADES_MAX_SIZE = 10_000
+
+
+def _payload_trade_id(data: dict) -> str:
+    """
+    Build a stable ID for a trade that carries no ID of its own.
+
+    Hashes the payload, so the same trade returned by consecutive polls
+    maps to the same ID and is de-duplicated.
+    """
+    payload = _json.dumps(dict(sorted(data.items()))).encode()
+    return f"trade_{hashlib.blake2b(payload, digest_size=12).hexdigest()}"
 
 
 class PolymarketRESTPoller:
@@ -40,6 +71,7 @@ class PolymarketRESTPoller:
         self,
         config: ScannerConfig | None = None,
         poll_interval: float = 5.0,
+        market_refresh_interval: float = 300.0,
     ):
         """
         Initialize REST poller.
@@ -47,18 +79,22 @@ class PolymarketRESTPoller:
         Args:
             config: Scanner configuration.
             poll_interval: Seconds between polls.
+            market_refresh_interval: Seconds between market cache refreshes.
         """
-        self._config = config or default_config
+        self._config = config or get_config()
         self._poll_interval = poll_interval
+        self._market_refresh_interval = market_refresh_interval
+        self._next_market_refresh = 0.0  # time.monotonic() deadline
         self._running = False
         self._seen_trades: set[str] = set()
+        self._seen_order: deque[str] = deque(maxlen=SEEN_TRADES_MAX_SIZE)
         self._markets_cache: dict[str, Market] = {}
         self._session: aiohttp.ClientSession | None = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            self._session = create_session()
         return self._session
 
     async def _fetch_markets(self) -> list[dict]:
@@ -89,27 +125,15 @@ class PolymarketRESTPoller:
 
     def _parse_market(self, data: dict) -> Market:
         """Parse market data from Gamma API."""
-        # Determine category from tags or question
-        question = data.get("question", "").lower()
-        category = MarketCategory.OTHER
-
-        if any(w in question for w in ["election", "trump", "biden", "president", "congress"]):
-            category = MarketCategory.POLITICS
-        elif any(w in question for w in ["bitcoin", "ethereum", "crypto", "btc", "eth"]):
-            category = MarketCategory.CRYPTO
-        elif any(w in question for w in ["nfl", "nba", "soccer", "football", "game", "match"]):
-            category = MarketCategory.SPORTS
-        elif any(w in question for w in ["fed", "inflation", "gdp", "economy", "rate"]):
-            category = MarketCategory.ECONOMICS
-        elif any(w in question for w in ["ai", "spacex", "nasa", "science"]):
-            category = MarketCategory.SCIENCE
+        # Determine category from question
+        category = _classify_question(data.get("question", ""))
 
         # Parse end date
         end_date = None
         end_str = data.get("endDate", "")
         if end_str:
             try:
-                end_date = datetime.fromisoformat(end_str.replace("Z", "+00:00"))
+                end_date = datetime.fromisoformat(end_str)
             except ValueError:
                 pass
 
@@ -185,42 +209,53 @@ class PolymarketRESTPoller:
 
         return []
 
-    def _parse_trade(self, data: dict) -> Trade | None:
-        """Parse trade data into Trade object."""
+    def _parse_trade(self, data: dict, now: datetime | None = None) -> Trade | None:
+        """
+        Parse trade data into Trade object.
+
+        Args:
+            data: Raw trade from the CLOB or Gamma activity API.
+            now: Fallback timestamp shared by a polled batch. Read from the
+                clock only if not given and the trade has no usable timestamp.
+
+        Returns:
+            Trade, or None if already seen or unparseable.
+        """
         try:
             # Different APIs have different formats
             trade_id = (
                 data.get("id")
                 or data.get("transactionHash")
                 or data.get("transaction_hash")
-                or f"trade_{datetime.now().timestamp()}"
+                or _payload_trade_id(data)
             )
 
             # Skip if already seen
             if trade_id in self._seen_trades:
                 return None
 
+            # Keep seen trades cache manageable: the deque drops its oldest
+            # ID on append once full, so forget that one first
+            if len(self._seen_order) == SEEN_TRADES_MAX_SIZE:
+                self._seen_trades.discard(self._seen_order[0])
+            self._seen_order.append(trade_id)
             self._seen_trades.add(trade_id)
 
-            # Keep seen trades cache manageable
-            if len(self._seen_trades) > 10000:
-                self._seen_trades = set(list(self._seen_trades)[-5000:])
-
             # Parse size and price
             size = safe_decimal(data.get("size", data.get("amount")))
-            price = safe_decimal(data.get("price"), Decimal("0.5"))
+            price = safe_decimal(data.get("price"), DEFAULT_PRICE)
 
             # Determine side
-            side_str = str(data.get("side", data.get("outcome", ""))).upper()
-            if side_str in ("BUY", "YES", "0"):
+            side_value = data.get("side", data.get("outcome", ""))
+            if is_yes_side(side_value):
                 side = TradeSide.YES
                 size_usd = size * price
             else:
                 side = TradeSide.NO
-                size_usd = size * (1 - price)
+                size_usd = size * (DECIMAL_ONE - price)
 
             # Parse timestamp
-            timestamp = datetime.now()
+            timestamp = None
             ts_value = data.get("timestamp", data.get("createdAt", ""))
             if ts_value:
                 try:
@@ -230,12 +265,14 @@ class PolymarketRESTPoller:
                         if ts_value.isdigit():
                             timestamp = datetime.fromtimestamp(int(ts_value))
                         else:
-                            timestamp = datetime.fromisoformat(ts_value.replace("Z", "+00:00"))
+                            timestamp = datetime.fromisoformat(ts_value)
                 except (ValueError, OSError):
                     pass
+            if timestamp is None:
+                timestamp = now or datetime.now()
 
-            # Get wallet address
-            wallet = (
+            # Get wallet address (interned for cheaper per-wallet dict lookups)
+            wallet = sys.intern(
                 data.get("taker", "")
                 or data.get("maker", "")
                 or data.get("user", "")
@@ -284,30 +321,42 @@ class PolymarketRESTPoller:
 
         # Initial market fetch
         await self._fetch_markets()
+        self._next_market_refresh = time.monotonic() + self._market_refresh_interval
 
         logger.info(f"Starting REST poller (interval: {self._poll_interval}s)")
 
         while self._running:
             try:
-                # Fetch from multiple sources
+                # Fetch from multiple sources concurrently: CLOB API
+                # (requires auth - will likely fail) and Gamma activity,
+                # plus a market refresh when its timer is due
                 all_trades = []
-
-                # Try CLOB API (requires auth - will likely fail)
-                clob_trades = await self._fetch_trades()
-                if clob_trades:
+                fetches = [self._fetch_trades(), self._fetch_activity()]
+                now = time.monotonic()
+                if now >= self._next_market_refresh:
+                    fetches.append(self._fetch_markets())
+                    self._next_market_refresh = now + self._market_refresh_interval
+                clob_trades, activity, *_ = await asyncio.gather(
+                    *fetches, return_exceptions=True
+                )
+
+                if isinstance(clob_trades, Exception):
+                    logger.warning(f"CLOB trades fetch failed: {clob_trades}")
+                elif clob_trades:
                     logger.info(f"Got {len(clob_trades)} from CLOB")
-                all_trades.extend(clob_trades)
+                    all_trades.extend(clob_trades)
 
-                # Try Gamma activity
-                activity = await self._fetch_activity()
-                if activity:
+                if isinstance(activity, Exception):
+                    logger.warning(f"Gamma activity fetch failed: {activity}")
+                elif activity:
                     logger.info(f"Got {len(activity)} from Gamma activity")
-                all_trades.extend(activity)
+                    all_trades.extend(activity)
 
                 # Parse and yield new trades
                 new_count = 0
+                now = datetime.now()
                 for trade_data in all_trades:
-                    trade = self._parse_trade(trade_data)
+                    trade = self._parse_trade(trade_data, now)
                     if trade and trade.size_usd > 0:
                         new_count += 1
                         yield trade
@@ -315,10 +364,6 @@ class PolymarketRESTPoller:
                 if new_count:
                     logger.info(f"New trades: {new_count}")
 
-                # Periodically refresh markets
-                if len(self._seen_trades) % 100 == 0:
-                    await self._fetch_markets()
-
             except Exception as e:
                 logger.error(f"Polling error: {e}")
 
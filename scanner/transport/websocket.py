@@ -1,22 +1,47 @@
 """Polymarket WebSocket transport."""
 
 import asyncio
-import json
 import logging
+import sys
 from collections.abc import AsyncIterator
+from contextlib import suppress
 from datetime import datetime
-from decimal import Decimal
 
 import aiohttp
 import websockets
 from websockets.exceptions import ConnectionClosed
 
-from scanner.config import ScannerConfig, config as default_config
+from scanner import _json
+from scanner.config import ScannerConfig, get_config
 from scanner.domain.models import Trade, TradeSide
+from scanner.transport._http import create_session
+from scanner.transport._numbers import DECIMAL_ONE, decimal_from_str
+from scanner.transport._sides import is_yes_side
 
 
 logger = logging.getLogger(__name__)
 
+# Frames handled between forced event-loop yields; recv() can return
+# buffered frames without suspending, which would starve other tasks
+WS_YIELD_EVERY = 100
+
+# Raw frames buffered between the receive task and the parser; when full,
+# the receive task waits and backpressure reaches the socket
+WS_QUEUE_MAX_SIZE = 1024
+
+# Queued frames above which a drained batch is parsed in a worker thread;
+# smaller batches are cheaper to parse inline than to hand off
+WS_PARSE_THREAD_THRESHOLD = 50
+
+# Event types that carry trades; every other event is dropped unparsed.
+# Both names contain "trade", so text frames without it skip JSON decoding
+_TRADE_EVENTS = frozenset({"trade", "last_trade_price"})
+_TRADE_EVENT_MARKER = "trade"
+
+# Fixed part of the /ws/market subscription frame; only the asset ID array
+# varies, so it is spliced in rather than encoding a fresh dict each time
+SUBSCRIBE_FRAME_PREFIX = '{"type":"subscribe","channel":"market","assets_ids":'
+
 
 class PolymarketWebSocket:
     """
@@ -43,11 +68,21 @@ class PolymarketWebSocket:
         Args:
             config: Scanner configuration.
         """
-        self._config = config or default_config
+        self._config = config or get_config()
         self._ws = None
         self._running = False
         self._subscribed_assets: set[str] = set()
         self._asset_to_market: dict[str, dict] = {}
+        self._http: aiohttp.ClientSession | None = None  # Reused across reconnects
+        # None is the end-of-stream sentinel put by the receive task
+        self._queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=WS_QUEUE_MAX_SIZE)
+        self._recv_task: asyncio.Task | None = None
+
+    async def _get_http(self) -> aiohttp.ClientSession:
+        """Get or create the aiohttp session for REST market lookups."""
+        if self._http is None or self._http.closed:
+            self._http = create_session()
+        return self._http
 
     async def _fetch_active_markets(self, limit: int = 100) -> list[str]:
         """
@@ -61,54 +96,54 @@ class PolymarketWebSocket:
         """
         asset_ids = []
 
-        async with aiohttp.ClientSession() as session:
+        session = await self._get_http()
+        try:
+            # Try CLOB API first
+            url = f"{self.REST_API}/markets?limit={limit}&active=true"
+            logger.info(f"Fetching active markets from {url}")
+
+            async with session.get(url) as resp:
+                if resp.status == 200:
+                    data = _json.loads(await resp.read())
+
+                    # CLOB API returns markets with tokens
+                    for market in data:
+                        if isinstance(market, dict):
+                            # Extract token IDs (assets)
+                            tokens = market.get("tokens", [])
+                            for token in tokens:
+                                token_id = token.get("token_id")
+                                if token_id:
+                                    asset_ids.append(token_id)
+                                    self._asset_to_market[token_id] = market
+
+                    logger.info(f"Found {len(asset_ids)} asset IDs from CLOB API")
+
+        except Exception as e:
+            logger.warning(f"CLOB API failed: {e}")
+
+        # If no assets found, try Gamma API
+        if not asset_ids:
             try:
-                # Try CLOB API first
-                url = f"{self.REST_API}/markets?limit={limit}&active=true"
-                logger.info(f"Fetching active markets from {url}")
+                url = f"{self.GAMMA_API}/markets?limit={limit}&active=true&closed=false"
+                logger.info(f"Trying Gamma API: {url}")
 
                 async with session.get(url) as resp:
                     if resp.status == 200:
-                        data = await resp.json()
+                        data = _json.loads(await resp.read())
 
-                        # CLOB API returns markets with tokens
                         for market in data:
                             if isinstance(market, dict):
-                                # Extract token IDs (assets)
-                                tokens = market.get("tokens", [])
-                                for token in tokens:
-                                    token_id = token.get("token_id")
+                                clob_ids = market.get("clobTokenIds", [])
+                                for token_id in clob_ids:
                                     if token_id:
                                         asset_ids.append(token_id)
                                         self._asset_to_market[token_id] = market
 
-                        logger.info(f"Found {len(asset_ids)} asset IDs from CLOB API")
+                        logger.info(f"Found {len(asset_ids)} asset IDs from Gamma API")
 
             except Exception as e:
-                logger.warning(f"CLOB API failed: {e}")
-
-            # If no assets found, try Gamma API
-            if not asset_ids:
-                try:
-                    url = f"{self.GAMMA_API}/markets?limit={limit}&active=true&closed=false"
-                    logger.info(f"Trying Gamma API: {url}")
-
-                    async with session.get(url) as resp:
-                        if resp.status == 200:
-                            data = await resp.json()
-
-                            for market in data:
-                                if isinstance(market, dict):
-                                    clob_ids = market.get("clobTokenIds", [])
-                                    for token_id in clob_ids:
-                                        if token_id:
-                                            asset_ids.append(token_id)
-                                            self._asset_to_market[token_id] = market
-
-                            logger.info(f"Found {len(asset_ids)} asset IDs from Gamma API")
-
-                except Exception as e:
-                    logger.error(f"Gamma API also failed: {e}")
+                logger.error(f"Gamma API also failed: {e}")
 
         return asset_ids[:limit]
 
@@ -130,10 +165,17 @@ class PolymarketWebSocket:
         """Close WebSocket connection."""
         self._running = False
 
+        if self._recv_task:
+            self._recv_task.cancel()
+
         if self._ws:
             await self._ws.close()
             self._ws = None
 
+        if self._http and not self._http.closed:
+            await self._http.close()
+        self._http = None
+
         logger.info("WebSocket disconnected")
 
     async def subscribe(self, asset_ids: list[str] | None = None) -> None:
@@ -154,53 +196,96 @@ class PolymarketWebSocket:
             logger.warning("No asset IDs to subscribe to!")
             return
 
-        # Polymarket subscription format for /ws/market
-        subscription = {
-            "type": "subscribe",
-            "channel": "market",
-            "assets_ids": asset_ids,
-        }
-
-        await self._ws.send(json.dumps(subscription))
+        # Polymarket subscription format for /ws/market; sent as text, since
+        # a bytes payload would go out as a binary frame
+        await self._ws.send(SUBSCRIBE_FRAME_PREFIX + _json.dumps(asset_ids) + "}")
         self._subscribed_assets.update(asset_ids)
 
         logger.info(f"Subscribed to {len(asset_ids)} assets")
 
-    async def trades(self) -> AsyncIterator[Trade]:
+    async def trades(self, asset_ids: list[str] | None = None) -> AsyncIterator[Trade]:
         """
         Iterate over incoming trades.
 
+        Frames are received by a separate task and handed over through a
+        bounded queue, so the socket keeps draining while the consumer
+        works on a trade. Queued frames are parsed as one batch, in a
+        worker thread when the backlog is large, keeping their order.
+
+        Args:
+            asset_ids: Asset IDs to subscribe to. If None, fetches active markets.
+
         Yields:
             Trade objects parsed from WebSocket messages.
         """
         # Connect and subscribe
         await self.connect()
-        await self.subscribe()
-
-        while self._running:
-            try:
-                if not self._ws:
-                    await self._reconnect()
-                    continue
+        await self.subscribe(asset_ids)
 
-                message = await self._ws.recv()
-                # Log raw messages for debugging
-                logger.info(f"WS message: {message[:300]}...")
-                trade = self._parse_message(message)
-
-                if trade:
+        self._queue = asyncio.Queue(maxsize=WS_QUEUE_MAX_SIZE)
+        self._recv_task = asyncio.create_task(self._recv_loop())
+        try:
+            while True:
+                messages = [await self._queue.get()]
+                while not self._queue.empty():
+                    messages.append(self._queue.get_nowait())
+
+                # The sentinel is the last item the receive task ever puts
+                done = messages[-1] is None
+                if done:
+                    messages.pop()
+
+                if len(messages) > WS_PARSE_THREAD_THRESHOLD:
+                    trades = await asyncio.to_thread(self._parse_messages, messages)
+                else:
+                    trades = self._parse_messages(messages)
+
+                for trade in trades:
                     yield trade
 
-            except ConnectionClosed:
-                logger.warning("WebSocket connection closed, reconnecting...")
-                await self._reconnect()
+                if done:
+                    break
+        finally:
+            self._recv_task.cancel()
+            self._recv_task = None
 
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse message: {e}")
+    async def _recv_loop(self) -> None:
+        """Receive frames into the queue, reconnecting on connection loss."""
+        frames = 0
+        cancelled = False
+        try:
+            while self._running:
+                try:
+                    if not self._ws:
+                        await self._reconnect()
+                        continue
+
+                    await self._queue.put(await self._ws.recv())
+                    frames += 1
+                    if frames >= WS_YIELD_EVERY:
+                        frames = 0
+                        await asyncio.sleep(0)
+
+                except ConnectionClosed:
+                    if not self._running:
+                        break
+                    logger.warning("WebSocket connection closed, reconnecting...")
+                    await self._reconnect()
 
-            except Exception as e:
-                logger.error(f"Error processing message: {e}")
-                await asyncio.sleep(1)
+                except Exception as e:
+                    logger.error(f"Error receiving message: {e}")
+                    await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            if cancelled:
+                # The consumer may be gone and not drain the queue
+                with suppress(asyncio.QueueFull):
+                    self._queue.put_nowait(None)
+            else:
+                # The consumer keeps draining, so no received frame is dropped
+                await self._queue.put(None)
 
     async def _reconnect(self) -> None:
         """Handle reconnection with backoff."""
@@ -216,6 +301,33 @@ class PolymarketWebSocket:
         except Exception as e:
             logger.error(f"Reconnection failed: {e}")
 
+    def _parse_messages(self, messages: list[str]) -> list[Trade]:
+        """
+        Parse a batch of WebSocket messages, skipping non-trades.
+
+        Args:
+            messages: Raw WebSocket messages, in arrival order.
+
+        Returns:
+            Trades parsed from the messages, in the same order.
+        """
+        trades = []
+        for message in messages:
+            try:
+                # Lazy %-formatting: the slice is only built when debug is on
+                logger.debug("WS message: %.300s", message)
+                trade = self._parse_message(message)
+            except _json.JSONDecodeError as e:
+                logger.error(f"Failed to parse message: {e}")
+                continue
+            except Exception as e:
+                logger.error(f"Error processing message: {e}")
+                continue
+
+            if trade:
+                trades.append(trade)
+        return trades
+
     def _parse_message(self, message: str) -> Trade | None:
         """
         Parse WebSocket message into Trade object.
@@ -250,8 +362,12 @@ class PolymarketWebSocket:
         Returns:
             Trade object or None if message is not a trade.
         """
+        # Book and price updates dominate the feed; skip them before decoding
+        if isinstance(message, str) and _TRADE_EVENT_MARKER not in message:
+            return None
+
         try:
-            data = json.loads(message)
+            data = _json.loads(message)
 
             # Handle array of events
             if isinstance(data, list):
@@ -271,24 +387,21 @@ class PolymarketWebSocket:
     def _parse_event(self, data: dict) -> Trade | None:
         """Parse a single event dict into a Trade."""
         try:
-            event_type = data.get("event_type", "")
-
             # Only process trade events
-            if event_type not in ("trade", "last_trade_price"):
+            if data.get("event_type") not in _TRADE_EVENTS:
                 return None
 
             # Parse trade data
-            size = Decimal(str(data.get("size", "0")))
-            price = Decimal(str(data.get("price", "0.5")))
+            size = decimal_from_str(str(data.get("size", "0")))
+            price = decimal_from_str(str(data.get("price", "0.5")))
 
             # Determine side: BUY = YES, SELL = NO
-            side_str = data.get("side", "").upper()
-            if side_str == "BUY":
+            if is_yes_side(data.get("side", "")):
                 side = TradeSide.YES
                 size_usd = size * price
             else:
                 side = TradeSide.NO
-                size_usd = size * (1 - price)
+                size_usd = size * (DECIMAL_ONE - price)
 
             # Parse timestamp
             timestamp_str = data.get("timestamp", "")
@@ -300,15 +413,17 @@ class PolymarketWebSocket:
             else:
                 timestamp = datetime.now()
 
-            # Get wallet address
-            wallet = data.get("taker_address") or data.get("maker_address") or "unknown"
+            # Get wallet address (interned for cheaper per-wallet dict lookups)
+            wallet = sys.intern(
+                data.get("taker_address") or data.get("maker_address") or "unknown"
+            )
 
             # Get market info if available
             asset_id = data.get("asset_id", "")
             market_info = self._asset_to_market.get(asset_id, {})
 
             trade = Trade(
-                id=data.get("transaction_hash", f"trade_{timestamp.timestamp()}"),
+                id=data.get("transaction_hash") or f"trade_{timestamp.timestamp()}",
                 market_id=data.get("market", asset_id),
                 wallet_address=wallet,
                 side=side,